@@ -0,0 +1,9 @@
+"""
+Querty-OS Python Compatibility Helpers
+Version-dependent settings shared across modules.
+"""
+
+import sys
+
+# dataclass(slots=True) needs Python 3.10+; use as @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
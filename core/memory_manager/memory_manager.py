@@ -6,10 +6,11 @@ Manages LLM context windows, task history, and memory purging.
 
 import json
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger("querty-memory-manager")
 
@@ -106,6 +107,10 @@ class ContextWindowManager:
         self.purge_rules = purge_rules or PurgeRules(max_context_tokens=max_tokens)
         self.task_history: List[TaskMemory] = []
         self.current_tokens = 0
+        # Conversation working set, least recently used first: id -> (role, content, tokens)
+        self.messages: "OrderedDict[int, Tuple[str, str, int]]" = OrderedDict()
+        self.message_tokens = 0
+        self._next_message_id = 0
         self._initialize_storage()
         logger.info(f"ContextWindowManager initialized with max_tokens={max_tokens}")
 
@@ -157,6 +162,73 @@ class ContextWindowManager:
         if len(self.task_history) > self.purge_rules.max_task_history:
             self.purge_memory()
 
+    def add_message(self, role: str, content: str, tokens: Optional[int] = None) -> int:
+        """
+        Add a message to the context working set.
+
+        Least recently used messages are pruned once the working set exceeds
+        max_tokens, as add_task purges the task history.
+
+        Args:
+            role: Message author (e.g. "user", "assistant")
+            content: Message text
+            tokens: Token count, estimated from the text length if omitted
+
+        Returns:
+            Message ID
+        """
+        if tokens is None:
+            tokens = max(1, len(content) // 4)
+
+        message_id = self._next_message_id
+        self._next_message_id += 1
+        self.messages[message_id] = (role, content, tokens)
+        self.message_tokens += tokens
+        logger.debug(
+            f"Added message {message_id}, message_tokens={self.message_tokens}/{self.max_tokens}"
+        )
+
+        if self.should_prune():
+            self.prune()
+
+        return message_id
+
+    def touch_message(self, message_id: int) -> bool:
+        """
+        Mark a message as recently used so it is evicted last.
+
+        Args:
+            message_id: Message ID
+
+        Returns:
+            True if the message is still in the working set
+        """
+        if message_id not in self.messages:
+            return False
+        self.messages.move_to_end(message_id)
+        return True
+
+    def should_prune(self) -> bool:
+        """Check whether the message working set exceeds the token budget."""
+        return self.message_tokens > self.max_tokens
+
+    def prune(self) -> int:
+        """
+        Evict least recently used messages until the working set fits.
+
+        Returns:
+            Number of tokens freed
+        """
+        freed = 0
+        while self.message_tokens > self.max_tokens and self.messages:
+            _, (_, _, tokens) = self.messages.popitem(last=False)
+            self.message_tokens -= tokens
+            freed += tokens
+
+        if freed:
+            logger.debug(f"Pruned {freed} message tokens, working set={self.message_tokens}")
+        return freed
+
     def purge_memory(self):
         """Clean up memory based on purge rules."""
         logger.info("Starting memory purge")
@@ -201,6 +273,8 @@ class ContextWindowManager:
             "newest_task": (
                 self.task_history[-1].timestamp.isoformat() if self.task_history else None
             ),
+            "total_messages": len(self.messages),
+            "message_tokens": self.message_tokens,
         }
 
     def get_recent_tasks(self, count: int = 10) -> List[TaskMemory]:
@@ -216,10 +290,12 @@ class ContextWindowManager:
         return self.task_history[-count:]
 
     def clear_all(self):
-        """Clear all task history."""
-        logger.warning("Clearing all task history")
+        """Clear all task history and the message working set."""
+        logger.warning("Clearing all task history and messages")
         self.task_history = []
         self.current_tokens = 0
+        self.messages.clear()
+        self.message_tokens = 0
         self.save_history()
 
     def optimize_context(self) -> int:
@@ -3,6 +3,6 @@ Plugin System Module
 Drop-in skills, tools, and sensors
 """
 
-from .plugin_system import Plugin, PluginManager, PluginType
+from .plugin_system import LazyPlugin, Plugin, PluginManager, PluginType
 
-__all__ = ["Plugin", "PluginManager", "PluginType"]
+__all__ = ["LazyPlugin", "Plugin", "PluginManager", "PluginType"]
@@ -4,6 +4,7 @@ Plugin System
 Manages drop-in skills, tools, and sensors for Querty-OS.
 """
 
+import importlib
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -55,10 +56,103 @@ class Plugin(ABC):
             "version": self.version,
             "type": self.plugin_type.value,
             "enabled": self.enabled,
-            "metadata": self.metadata,
+            "metadata": dict(self.metadata),
         }
 
 
+class LazyPlugin(Plugin):
+    """
+    Plugin whose module is imported on first use.
+
+    Name, version and type are given up front, so the plugin can be listed,
+    enabled, disabled and unloaded without importing its module. The module
+    is imported, and the plugin constructed and initialized, by the first
+    ``initialize()`` or ``execute()`` call.
+    """
+
+    def __init__(
+        self, name: str, version: str, plugin_type: PluginType, module_path: str, class_name: str
+    ):
+        """
+        Initialize lazy plugin.
+
+        Args:
+            name: Plugin name
+            version: Plugin version
+            plugin_type: Plugin type
+            module_path: Dotted path of the module defining the plugin
+            class_name: Name of the Plugin subclass in that module
+        """
+        self._module_path = module_path
+        self._class_name = class_name
+        self._plugin: Optional[Plugin] = None
+        self._enabled = False
+        super().__init__(name, version, plugin_type)
+
+    @property
+    def enabled(self) -> bool:
+        """Enabled state of the loaded plugin, or the requested state until it is loaded."""
+        if self._plugin is None:
+            return self._enabled
+        return self._plugin.enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        if self._plugin is None:
+            self._enabled = value
+        else:
+            self._plugin.enabled = value
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the plugin's module has been imported and the plugin initialized."""
+        return self._plugin is not None
+
+    def _load(self) -> Optional[Plugin]:
+        """
+        Import, construct and initialize the plugin on first use.
+
+        A plugin whose initialize() fails is not kept, so the next call
+        tries again, and the proxy is disabled.
+
+        Returns:
+            The initialized plugin, or None if initialization failed
+        """
+        plugin = self._plugin
+        if plugin is None:
+            module = importlib.import_module(self._module_path)
+            plugin = getattr(module, self._class_name)()
+            if not plugin.initialize():
+                logger.warning(f"Plugin '{self.name}' failed to initialize")
+                self._enabled = False
+                return None
+            self._plugin = plugin
+            self.metadata = plugin.metadata
+            logger.info(f"Lazily loaded plugin: {self.name}")
+        return plugin
+
+    def initialize(self) -> bool:
+        """Load the plugin now instead of on first execute."""
+        return self._load() is not None
+
+    def execute(self, **kwargs) -> Any:
+        """
+        Execute the underlying plugin, loading it if needed.
+
+        Raises:
+            RuntimeError: If the plugin fails to initialize
+        """
+        plugin = self._load()
+        if plugin is None:
+            raise RuntimeError(f"Plugin '{self.name}' failed to initialize")
+        return plugin.execute(**kwargs)
+
+    def shutdown(self):
+        """Shut down the underlying plugin; nothing to do if it was never loaded."""
+        if self._plugin is not None:
+            self._plugin.shutdown()
+
+
 @dataclass
 class PluginMetadata:
     """Plugin metadata."""
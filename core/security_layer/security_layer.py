@@ -4,14 +4,17 @@ Querty-OS Security Layer
 Provides sandboxing, prompt filtering, audit logging, and permission management.
 """
 
+import atexit
 import json
 import logging
 import re
+import threading
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 logger = logging.getLogger("querty-security-layer")
 
@@ -57,11 +60,18 @@ class PromptFirewall:
 
     def __init__(self):
         """Initialize prompt firewall."""
-        self.blocked_patterns = self._load_blocked_patterns()
+        # Replaced, never mutated, so the combined regex always matches this tuple
+        self._blocked_patterns = tuple(self._load_blocked_patterns())
+        self._combined_pattern = self._combine_patterns(self._blocked_patterns)
         self.suspicious_keywords = self._load_suspicious_keywords()
         self.block_count = 0
         logger.info("PromptFirewall initialized")
 
+    @property
+    def blocked_patterns(self) -> Tuple[re.Pattern, ...]:
+        """Blocked patterns in check order; use add_blocked_pattern() to extend."""
+        return self._blocked_patterns
+
     def _load_blocked_patterns(self) -> List[re.Pattern]:
         """Load patterns for dangerous prompts."""
         patterns = [
@@ -79,6 +89,41 @@ class PromptFirewall:
         ]
         return [re.compile(p) for p in patterns]
 
+    @staticmethod
+    def _combine_patterns(patterns: Sequence[re.Pattern]) -> Optional[re.Pattern]:
+        """
+        Merge blocked patterns into one alternation so a prompt is scanned once.
+
+        Each pattern becomes a named group ``p<index>`` with its flags scoped to
+        that group. Returns None if the patterns cannot be merged (backreferences,
+        conditionals, verbose mode), in which case they are checked one by one.
+        """
+        parts = []
+        for index, pattern in enumerate(patterns):
+            # Group references would point at the wrong group once merged, and a
+            # verbose-mode comment would swallow the wrapping parenthesis
+            if pattern.flags & re.VERBOSE or re.search(r"\\[1-9]|\(\?P=|\(\?\(", pattern.pattern):
+                return None
+            body = re.sub(r"^\(\?[aiLmsux]+\)", "", pattern.pattern)
+            flags = "".join(
+                letter
+                for letter, flag in (
+                    ("a", re.ASCII),
+                    ("i", re.IGNORECASE),
+                    ("m", re.MULTILINE),
+                    ("s", re.DOTALL),
+                )
+                if pattern.flags & flag
+            )
+            if flags:
+                body = f"(?{flags}:{body})"
+            parts.append(f"(?P<p{index}>{body})")
+
+        try:
+            return re.compile("|".join(parts))
+        except re.error:
+            return None
+
     def _load_suspicious_keywords(self) -> Set[str]:
         """Load suspicious keywords."""
         return {
@@ -103,12 +148,19 @@ class PromptFirewall:
         Returns:
             Tuple of (is_safe, reason_if_blocked)
         """
-        for pattern in self.blocked_patterns:
-            if pattern.search(prompt):
-                self.block_count += 1
-                reason = f"Blocked: matches dangerous pattern {pattern.pattern}"
-                logger.warning(f"Prompt blocked: {reason}")
-                return False, reason
+        if self._combined_pattern is not None:
+            match = self._combined_pattern.search(prompt)
+            matched = (
+                self._blocked_patterns[int(match.lastgroup[1:])] if match is not None else None
+            )
+        else:
+            matched = next((p for p in self._blocked_patterns if p.search(prompt)), None)
+
+        if matched is not None:
+            self.block_count += 1
+            reason = f"Blocked: matches dangerous pattern {matched.pattern}"
+            logger.warning(f"Prompt blocked: {reason}")
+            return False, reason
 
         prompt_lower = prompt.lower()
         suspicious_found = [kw for kw in self.suspicious_keywords if kw in prompt_lower]
@@ -151,7 +203,8 @@ class PromptFirewall:
         Args:
             pattern: Regex pattern to block
         """
-        self.blocked_patterns.append(re.compile(pattern))
+        self._blocked_patterns += (re.compile(pattern),)
+        self._combined_pattern = self._combine_patterns(self._blocked_patterns)
         logger.info(f"Added blocked pattern: {pattern}")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -166,18 +219,46 @@ class PromptFirewall:
 class AuditLogger:
     """Logs security events for auditing."""
 
-    def __init__(self, log_path: Optional[Path] = None):
+    def __init__(
+        self,
+        log_path: Optional[Path] = None,
+        flush_interval: float = 1.0,
+        flush_count: int = 100,
+    ):
         """
         Initialize audit logger.
 
+        Events are buffered and appended to the log file in batches, either
+        every ``flush_interval`` seconds or once ``flush_count`` events are
+        pending, whichever comes first. The background flusher starts with
+        the first event, and close() stops it; the logger can also be used
+        as a context manager.
+
         Args:
             log_path: Path for audit logs
+            flush_interval: Seconds between background flushes
+            flush_count: Pending events that trigger an early flush
         """
         self.log_path = log_path or Path.home() / ".querty" / "security" / "audit.log"
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
         self.events: List[SecurityEvent] = []
+        self.flush_interval = flush_interval
+        self.flush_count = flush_count
+
+        self._buffer: deque = deque()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = threading.Event()
+        # Started by the first buffered event, so idle loggers cost no thread
+        self._flusher: Optional[threading.Thread] = None
         logger.info(f"AuditLogger initialized at {self.log_path}")
 
+    def __enter__(self) -> "AuditLogger":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def log_event(
         self,
         event_type: str,
@@ -210,20 +291,57 @@ class AuditLogger:
         )
 
         self.events.append(event)
-        self._write_to_file(event)
+        line = json.dumps(event.to_dict()) + "\n"
+        with self._lock:
+            self._buffer.append(line)
+            pending = len(self._buffer)
+            closed = self._closed.is_set()
+            if self._flusher is None and not closed:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="audit-flush", daemon=True
+                )
+                self._flusher.start()
+                atexit.register(self.flush)
+        if closed:
+            # No flusher after close; write through
+            self.flush()
+        elif pending >= self.flush_count:
+            self._wakeup.set()
 
         if level in [SecurityLevel.HIGH, SecurityLevel.CRITICAL]:
             logger.warning(f"Security event [{level.value}]: {description}")
         else:
             logger.info(f"Security event [{level.value}]: {description}")
 
-    def _write_to_file(self, event: SecurityEvent):
-        """Write event to audit log file."""
-        try:
-            with open(self.log_path, "a") as f:
-                f.write(json.dumps(event.to_dict()) + "\n")
-        except Exception as e:
-            logger.error(f"Error writing to audit log: {e}")
+    def _flush_loop(self):
+        """Flush buffered events periodically until closed."""
+        while not self._closed.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self):
+        """Write all buffered events to the audit log file in one append."""
+        with self._lock:
+            if not self._buffer:
+                return
+            try:
+                with open(self.log_path, "a") as f:
+                    f.writelines(self._buffer)
+                self._buffer.clear()
+            except Exception as e:
+                logger.error(f"Error writing to audit log: {e}")
+
+    def close(self):
+        """Stop the background flusher and write any pending events."""
+        with self._lock:
+            self._closed.set()
+            flusher = self._flusher
+        if flusher is not None:
+            self._wakeup.set()
+            flusher.join()
+            atexit.unregister(self.flush)
+        self.flush()
 
     def get_events(
         self,
@@ -3,21 +3,68 @@ Incremental backup engine tracking changed files.
 Efficiently backs up only modified files since last backup.
 """
 
+import dbm
 import hashlib
+import io
 import json
 import logging
+import mmap
+import os
+import random
+import re
+import secrets
 import shutil
-from dataclasses import asdict, dataclass
+import struct
+import sys
+import threading
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from stat import S_IMODE
+from typing import Callable, Dict, Iterator, List, Optional, Pattern, Tuple, Union
 
+from core.compat import DATACLASS_SLOTS
 from core.exceptions import SnapshotError
 
-logger = logging.getLogger(__name__)
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json module
+    orjson = None
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Worker count for checksum computation (hashlib releases the GIL while hashing)
+SCAN_WORKERS = os.cpu_count() or 1
+# Worker count for directory traversal (latency-bound on network filesystems)
+WALK_WORKERS = min(32, SCAN_WORKERS * 4)
+# Read size for checksum computation
+CHECKSUM_CHUNK_SIZE = 4 * 1024 * 1024
+# Files up to this size are hashed in batches, one pool task per batch
+SMALL_FILE_SIZE = 64 * 1024
+SMALL_FILE_BATCH = 64
+# Backup copies up to this size are verified through mmap; larger ones are read in chunks
+MMAP_MAX_SIZE = 512 * 1024 * 1024
+# Worker count for copying changed files into the backup
+COPY_WORKERS = min(32, SCAN_WORKERS * 4)
+# Bytes per os.copy_file_range call
+COPY_CHUNK_SIZE = 64 * 1024 * 1024
+# ioctl request for reflink copies on Btrfs/XFS (linux/fs.h)
+FICLONE = 0x40049409
+# Persistent file index record: size, mtime, inode, followed by the checksum
+INDEX_RECORD = struct.Struct("<qdQ")
+
+
+def _json_bytes(obj) -> bytes:
+    """Encode an object as compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+@dataclass(**DATACLASS_SLOTS)
 class FileMetadata:
     """Metadata for a tracked file."""
 
@@ -27,9 +74,10 @@ class FileMetadata:
     checksum: str
     backed_up: bool = False
     backup_path: Optional[str] = None
+    inode: int = 0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BackupManifest:
     """Manifest for an incremental backup."""
 
@@ -50,19 +98,65 @@ class BackupManifest:
             self.files = {}
 
 
+class PersistedFileIndex(Mapping):
+    """Read-only view of one source's entries in the persistent file index."""
+
+    def __init__(self, db, source_path: str):
+        self._db = db
+        self._prefix = f"{source_path}\0".encode()
+
+    def __getitem__(self, relative_path: str) -> FileMetadata:
+        try:
+            raw = self._db.get(self._prefix + relative_path.encode())
+            if raw is None:
+                raise KeyError(relative_path)
+            size, mtime, inode = INDEX_RECORD.unpack_from(raw)
+            checksum = raw[INDEX_RECORD.size :].decode()
+        except (*dbm.error, struct.error, UnicodeDecodeError):
+            # An unreadable record only costs a rehash of the file
+            raise KeyError(relative_path)
+        return FileMetadata(
+            path=relative_path,
+            size=size,
+            mtime=mtime,
+            checksum=checksum,
+            inode=inode,
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        # Full key scan; lookups by path are the intended access pattern
+        for key in self._db.keys():
+            if key.startswith(self._prefix):
+                yield key[len(self._prefix) :].decode()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
 class IncrementalBackup:
     """Incremental backup engine with change tracking."""
 
-    def __init__(self, backup_dir: str = "/data/backups"):
+    def __init__(
+        self, backup_dir: str = "/data/backups", parallel: bool = True, deduplicate: bool = True
+    ):
         """
         Initialize incremental backup engine.
 
         Args:
             backup_dir: Directory to store backups
+            parallel: Compute checksums concurrently (disable for NFS/HDD sources)
+            deduplicate: Store identical content once and hardlink it into backups
         """
         self.backup_dir = Path(backup_dir)
+        self.pool_dir = self.backup_dir / "pool"
+        self.index_db_path = self.backup_dir / "file_index"
+        self.parallel = parallel
+        self.deduplicate = deduplicate
+        self._pool_links = True  # cleared if the backup filesystem rejects hardlinks
+        self._read_buffers = threading.local()
         self.manifests: Dict[str, BackupManifest] = {}
         self.file_index: Dict[str, Dict[str, FileMetadata]] = {}  # source_path -> file_index
+        self._chain_cache: Dict[str, Tuple[str, ...]] = {}  # backup_id -> chain (oldest first)
 
         try:
             self.backup_dir.mkdir(parents=True, exist_ok=True)
@@ -75,60 +169,282 @@ class IncrementalBackup:
             )
 
     def _generate_backup_id(self) -> str:
-        """Generate unique backup ID."""
-        timestamp = datetime.now().isoformat()
-        data = f"{timestamp}:{len(self.manifests)}"
-        return hashlib.sha256(data.encode()).hexdigest()[:16]
+        """Generate unique backup ID (16 hex chars)."""
+        return secrets.token_hex(8)
+
+    def _open_for_read(self, file_path: Union[str, Path]) -> int:
+        """
+        Open a file read-only, skipping atime updates where permitted.
+
+        Args:
+            file_path: Path to file
 
-    def _calculate_file_checksum(self, file_path: Path) -> str:
+        Returns:
+            Raw file descriptor
+        """
+        noatime = getattr(os, "O_NOATIME", 0)
+        if noatime:
+            try:
+                return os.open(file_path, os.O_RDONLY | noatime)
+            except PermissionError:
+                # O_NOATIME requires owning the file
+                pass
+        return os.open(file_path, os.O_RDONLY)
+
+    def _calculate_file_checksum(
+        self,
+        file_path: Union[str, Path],
+        size: Optional[int] = None,
+        use_mmap: bool = False,
+        drop_cache: bool = False,
+    ) -> str:
         """
         Calculate MD5 checksum of file (fast for change detection).
 
+        Files are read into a reusable per-thread buffer by default. Mapping
+        a file that another process truncates raises SIGBUS, so use_mmap is
+        only for files nothing else writes to, such as backup copies.
+
         Args:
             file_path: Path to file
+            size: File size from a prior stat, if known
+            use_mmap: Hash medium files through a memory mapping in one update
+            drop_cache: Advise the kernel to drop the file's pages afterwards;
+                leave unset when the file is about to be read again
 
         Returns:
             Hex digest of checksum
         """
         md5 = hashlib.md5(usedforsecurity=False)  # nosec B324 - used for file checksums, not crypto
-        with open(file_path, "rb") as f:
-            while True:
-                chunk = f.read(8192 * 16)  # 128KB chunks
-                if not chunk:
-                    break
-                md5.update(chunk)
+        fd = self._open_for_read(file_path)
+        with io.FileIO(fd, "rb") as f:
+            fadvise = getattr(os, "posix_fadvise", None)
+            if size is not None and size <= SMALL_FILE_SIZE:
+                # Read in one call; the page-cache hints cost more than they save
+                fadvise = None
+            if fadvise:
+                fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+            if use_mmap and size is not None and SMALL_FILE_SIZE < size <= MMAP_MAX_SIZE:
+                # Hash the whole mapping in one update call
+                try:
+                    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                        md5.update(mapped)
+                except ValueError:
+                    # File was truncated to zero bytes since it was stat'ed
+                    pass
+            else:
+                buf = getattr(self._read_buffers, "buf", None)
+                if buf is None:
+                    buf = self._read_buffers.buf = bytearray(CHECKSUM_CHUNK_SIZE)
+                view = memoryview(buf)
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    md5.update(view[:n])
+
+            if fadvise and drop_cache:
+                fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
         return md5.hexdigest()
 
-    def _scan_directory(self, source_path: Path) -> Dict[str, FileMetadata]:
+    def _checksum_batch(self, files: List[Tuple[str, int]]) -> List[str]:
         """
-        Scan directory and build file index.
+        Calculate checksums for a batch of files in one task.
 
         Args:
-            source_path: Directory to scan
+            files: List of (path, size) tuples
 
         Returns:
-            Dictionary mapping relative path to FileMetadata
+            List of hex digests in input order
         """
-        file_index = {}
+        return [self._calculate_file_checksum(path, size) for path, size in files]
 
-        try:
-            for file_path in source_path.rglob("*"):
-                if file_path.is_file():
-                    relative_path = str(file_path.relative_to(source_path))
-                    stat = file_path.stat()
-
-                    # Calculate checksum
-                    checksum = self._calculate_file_checksum(file_path)
-
-                    file_index[relative_path] = FileMetadata(
-                        path=relative_path,
-                        size=stat.st_size,
-                        mtime=stat.st_mtime,
-                        checksum=checksum,
-                    )
+    def _compile_excludes(self, exclude_patterns: Optional[List[str]]) -> Optional[Pattern[str]]:
+        """
+        Compile exclusion substrings into a single alternation regex.
 
-            logger.debug(f"Scanned {len(file_index)} files from {source_path}")
-            return file_index
+        Args:
+            exclude_patterns: Substrings that exclude a relative path
+
+        Returns:
+            Compiled pattern, or None if there is nothing to exclude
+        """
+        if not exclude_patterns:
+            return None
+        return re.compile("|".join(re.escape(pattern) for pattern in exclude_patterns))
+
+    def _list_directory(
+        self, directory: str, prefix: str, exclude: Optional[Pattern[str]] = None
+    ) -> Tuple[List[Tuple[str, str, os.stat_result]], List[Tuple[str, str]]]:
+        """
+        List a single directory with os.scandir.
+
+        Uses the file type and stat information cached on each DirEntry, so
+        each file costs a single stat call. Symlinked directories are not
+        followed. Excluded directories are pruned, since every path below
+        them contains the matched substring too.
+
+        Args:
+            directory: Absolute directory path
+            prefix: Path of the directory relative to the scan root
+            exclude: Pattern matching relative paths to skip
+
+        Returns:
+            Tuple of (files, subdirectories) where files are
+            (relative_path, absolute_path, stat_result) tuples and
+            subdirectories are (absolute_path, relative_path) tuples
+        """
+        files = []
+        subdirs = []
+        with os.scandir(directory) as it:
+            for entry in it:
+                relative_path = os.path.join(prefix, entry.name)
+                if exclude is not None and exclude.search(relative_path):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((entry.path, relative_path))
+                elif entry.is_file():
+                    files.append((relative_path, entry.path, entry.stat()))
+        return files, subdirs
+
+    def _walk_files(
+        self, source_path: Path, exclude: Optional[Pattern[str]] = None
+    ) -> Iterator[Tuple[str, str, os.stat_result]]:
+        """
+        Recursively walk a directory depth-first on the calling thread.
+
+        Args:
+            source_path: Directory to walk
+            exclude: Pattern matching relative paths to skip
+
+        Yields:
+            Tuples of (relative_path, absolute_path, stat_result)
+        """
+        pending = [(str(source_path), "")]
+        while pending:
+            files, subdirs = self._list_directory(*pending.pop(), exclude)
+            yield from files
+            pending.extend(subdirs)
+
+    def _walk_files_parallel(
+        self, source_path: Path, exclude: Optional[Pattern[str]] = None
+    ) -> Iterator[Tuple[str, str, os.stat_result]]:
+        """
+        Recursively walk a directory, listing directories concurrently.
+
+        Each directory is one task; subdirectories found by a task are
+        submitted back to the pool, so the number of open directory
+        handles is bounded by the pool size. Files are yielded as soon as
+        their directory has been listed, in nondeterministic order.
+
+        Args:
+            source_path: Directory to walk
+            exclude: Pattern matching relative paths to skip
+
+        Yields:
+            Tuples of (relative_path, absolute_path, stat_result)
+        """
+        with ThreadPoolExecutor(max_workers=WALK_WORKERS) as executor:
+            pending = {executor.submit(self._list_directory, str(source_path), "", exclude)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs = future.result()
+                    for subdir in subdirs:
+                        pending.add(executor.submit(self._list_directory, *subdir, exclude))
+                    yield from files
+
+    def _iter_scan(
+        self,
+        source_path: Path,
+        previous_index: Optional[Mapping] = None,
+        parallel: bool = True,
+        exclude: Optional[Pattern[str]] = None,
+    ) -> Iterator[FileMetadata]:
+        """
+        Scan a directory, yielding file metadata as checksums become available.
+
+        Files whose size, mtime and inode match the previous index reuse the
+        recorded checksum instead of being hashed again and are yielded
+        immediately. In parallel mode, checksums are submitted as soon as
+        each directory is listed, so hashing overlaps with the rest of the
+        walk, and finished batches are yielded while the walk continues.
+
+        Args:
+            source_path: Directory to scan
+            previous_index: Index of previously recorded files, if any
+            parallel: Walk and compute checksums in thread pools
+            exclude: Pattern matching relative paths to skip (never hashed)
+
+        Yields:
+            FileMetadata for each file, in nondeterministic order
+        """
+        if previous_index is None:
+            previous_index = {}
+        hasher = ThreadPoolExecutor(max_workers=SCAN_WORKERS) if parallel else None
+
+        try:
+            scanned_count = 0
+            hashed_count = 0
+            # Pool tasks as (future, metadata) in submission order; small files
+            # are grouped so per-task overhead does not dominate their hashing
+            batches: deque = deque()
+            small_files = []
+            small_metadata = []
+            if parallel:
+                walk = self._walk_files_parallel(source_path, exclude)
+            else:
+                walk = self._walk_files(source_path, exclude)
+
+            for relative_path, file_path, stat in walk:
+                scanned_count += 1
+                fm = FileMetadata(
+                    path=relative_path,
+                    size=stat.st_size,
+                    mtime=stat.st_mtime,
+                    checksum="",
+                    inode=stat.st_ino,
+                )
+                previous = previous_index.get(relative_path)
+                if (
+                    previous is not None
+                    and previous.size == stat.st_size
+                    and previous.mtime == stat.st_mtime
+                    and previous.inode == stat.st_ino
+                ):
+                    fm.checksum = previous.checksum
+                    yield fm
+                elif hasher is None:
+                    fm.checksum = self._calculate_file_checksum(file_path, stat.st_size)
+                    hashed_count += 1
+                    yield fm
+                elif stat.st_size <= SMALL_FILE_SIZE:
+                    small_files.append((file_path, stat.st_size))
+                    small_metadata.append(fm)
+                    hashed_count += 1
+                    if len(small_files) >= SMALL_FILE_BATCH:
+                        future = hasher.submit(self._checksum_batch, small_files)
+                        batches.append((future, small_metadata))
+                        small_files, small_metadata = [], []
+                else:
+                    future = hasher.submit(self._checksum_batch, [(file_path, stat.st_size)])
+                    batches.append((future, [fm]))
+                    hashed_count += 1
+
+                # Hand over finished batches without waiting for the walk
+                while batches and batches[0][0].done():
+                    yield from self._resolve_batch(*batches.popleft())
+
+            if small_files:
+                batches.append((hasher.submit(self._checksum_batch, small_files), small_metadata))
+            while batches:
+                yield from self._resolve_batch(*batches.popleft())
+
+            logger.debug(
+                f"Scanned {scanned_count} files from {source_path} "
+                f"({hashed_count} hashed, {scanned_count - hashed_count} unchanged)"
+            )
 
         except Exception as e:
             logger.error(f"Failed to scan directory: {e}")
@@ -137,42 +453,24 @@ class IncrementalBackup:
                 error_code="SCAN_FAILED",
                 details={"path": str(source_path)},
             )
+        finally:
+            if hasher:
+                hasher.shutdown(cancel_futures=True)
 
-    def _detect_changes(
-        self, current_index: Dict[str, FileMetadata], previous_index: Dict[str, FileMetadata]
-    ) -> tuple[Set[str], Set[str], Set[str]]:
+    def _resolve_batch(self, future: Future, batch: List[FileMetadata]) -> List[FileMetadata]:
         """
-        Detect file changes between two indices.
+        Fill in checksums from a finished hashing task.
 
         Args:
-            current_index: Current file index
-            previous_index: Previous file index
+            future: Future returned by _checksum_batch
+            batch: Metadata for the files in the task, in task order
 
         Returns:
-            Tuple of (new_files, modified_files, deleted_files)
+            The batch with checksums set
         """
-        current_files = set(current_index.keys())
-        previous_files = set(previous_index.keys())
-
-        new_files = current_files - previous_files
-        deleted_files = previous_files - current_files
-        potentially_modified = current_files & previous_files
-
-        # Check which files actually changed
-        modified_files = set()
-        for file_path in potentially_modified:
-            current = current_index[file_path]
-            previous = previous_index[file_path]
-
-            # Compare checksum for definitive change detection
-            if current.checksum != previous.checksum:
-                modified_files.add(file_path)
-
-        logger.debug(
-            f"Changes detected: {len(new_files)} new, {len(modified_files)} modified, "
-            f"{len(deleted_files)} deleted"
-        )
-        return (new_files, modified_files, deleted_files)
+        for fm, checksum in zip(batch, future.result()):
+            fm.checksum = checksum
+        return batch
 
     def create_backup(
         self,
@@ -180,15 +478,20 @@ class IncrementalBackup:
         name: str,
         parent_backup_id: Optional[str] = None,
         exclude_patterns: Optional[List[str]] = None,
+        paranoid: bool = False,
     ) -> BackupManifest:
         """
         Create an incremental backup.
 
+        Files whose size, mtime and inode match a previously recorded entry
+        reuse its checksum unless paranoid is set.
+
         Args:
             source_path: Path to backup
             name: Backup name
             parent_backup_id: Parent backup for incremental (None for full)
             exclude_patterns: Patterns to exclude
+            paranoid: Rehash every file, e.g. for verification backups
 
         Returns:
             BackupManifest object
@@ -211,47 +514,91 @@ class IncrementalBackup:
         try:
             logger.info(f"Creating backup: {name} (id={backup_id})")
 
-            # Scan current state
-            current_index = self._scan_directory(source)
-
-            # Apply exclusions
-            if exclude_patterns:
-                for pattern in exclude_patterns:
-                    current_index = {k: v for k, v in current_index.items() if pattern not in k}
-
-            # Determine changes
-
+            parent_manifest = None
             if parent_backup_id and parent_backup_id in self.manifests:
                 parent_manifest = self.manifests[parent_backup_id]
-                previous_index = parent_manifest.files
-                new_files, modified_files, deleted_files = self._detect_changes(
-                    current_index, previous_index
-                )
-            else:
-                # Full backup - all files are new
-                new_files = set(current_index.keys())
-                modified_files = set()
-                deleted_files = set()
+
+            # Stream the scan straight into change detection and copying:
+            # reused checksums are known immediately, hashed ones arrive as
+            # their batches finish, and changed files are copied right away
+            previous_index = parent_manifest.files if parent_manifest else {}
+            if not parent_manifest:
                 logger.info("Creating full backup (no parent)")
 
-            # Copy changed files
-            files_to_backup = new_files | modified_files
+            current_index = {}
+            new_files = 0
+            modified_files = 0
             total_size = 0
-
-            for file_path in files_to_backup:
-                source_file = source / file_path
-                dest_file = backup_subdir / file_path
-
-                # Create parent directories
-                dest_file.parent.mkdir(parents=True, exist_ok=True)
-
-                # Copy file
-                shutil.copy2(source_file, dest_file)
-
-                # Update metadata
-                current_index[file_path].backed_up = True
-                current_index[file_path].backup_path = str(dest_file)
-                total_size += current_index[file_path].size
+            created_dirs = set()
+            copy_futures = []
+            copier = ThreadPoolExecutor(max_workers=COPY_WORKERS) if self.parallel else None
+
+            # The persisted index is only consulted when nothing fresher is known
+            index_db = None
+            if paranoid:
+                known_index = None
+            elif parent_manifest:
+                known_index = parent_manifest.files
+            elif source_path in self.file_index:
+                known_index = self.file_index[source_path]
+            else:
+                index_db = self._open_file_index()
+                known_index = {}
+                if index_db is not None:
+                    known_index = PersistedFileIndex(index_db, str(source.resolve()))
+
+            try:
+                for fm in self._iter_scan(
+                    source,
+                    previous_index=known_index,
+                    parallel=self.parallel,
+                    exclude=self._compile_excludes(exclude_patterns),
+                ):
+                    current_index[fm.path] = fm
+
+                    previous = previous_index.get(fm.path)
+                    if previous is None:
+                        new_files += 1
+                    elif previous.checksum != fm.checksum:
+                        modified_files += 1
+                    else:
+                        continue
+
+                    # Create each destination directory once
+                    parent_dir = os.path.dirname(fm.path)
+                    if parent_dir not in created_dirs:
+                        os.makedirs(backup_subdir / parent_dir, exist_ok=True)
+                        created_dirs.add(parent_dir)
+
+                    dest_file = backup_subdir / fm.path
+                    job = (source / fm.path, dest_file, fm.checksum)
+                    if copier:
+                        copy_futures.append(copier.submit(self._store_file, *job))
+                    else:
+                        self._store_file(*job)
+
+                    fm.backed_up = True
+                    fm.backup_path = str(dest_file)
+                    total_size += fm.size
+
+                # Surface copy errors
+                for future in copy_futures:
+                    future.result()
+            finally:
+                if copier:
+                    copier.shutdown(cancel_futures=True)
+                if index_db is not None:
+                    index_db.close()
+
+            # Walk order is nondeterministic; keep manifests stable
+            current_index = dict(sorted(current_index.items()))
+            deleted_files = len(previous_index.keys() - current_index.keys())
+            files_backed_up = new_files + modified_files
+
+            logger.debug(
+                f"Changes detected: {new_files} new, {modified_files} modified, "
+                f"{deleted_files} deleted"
+            )
 
             # Create manifest
             manifest = BackupManifest(
@@ -262,9 +609,9 @@ class IncrementalBackup:
                 created_at=datetime.now(),
                 parent_backup_id=parent_backup_id,
                 files=current_index,
-                new_files=len(new_files),
-                modified_files=len(modified_files),
-                deleted_files=len(deleted_files),
+                new_files=new_files,
+                modified_files=modified_files,
+                deleted_files=deleted_files,
                 total_size=total_size,
             )
 
@@ -273,10 +620,13 @@ class IncrementalBackup:
 
             self.manifests[backup_id] = manifest
             self.file_index[source_path] = current_index
+            self._persist_file_index(source, current_index)
+            if parent_manifest:
+                self._chain_cache[backup_id] = self._resolve_chain(parent_backup_id) + (backup_id,)
+            else:
+                self._chain_cache[backup_id] = (backup_id,)
 
-            logger.info(
-                f"Created backup: {name} ({len(files_to_backup)} files, {total_size} bytes)"
-            )
+            logger.info(f"Created backup: {name} ({files_backed_up} files, {total_size} bytes)")
             return manifest
 
         except Exception as e:
@@ -290,6 +640,225 @@ class IncrementalBackup:
                 details={"source": source_path, "error": str(e)},
             )
 
+    def _reflink(self, src_fd: int, dst_fd: int) -> bool:
+        """
+        Try to clone a file via the FICLONE ioctl (no data copied).
+
+        Args:
+            src_fd: Source file descriptor
+            dst_fd: Destination file descriptor
+
+        Returns:
+            True if the clone succeeded, False if unsupported
+        """
+        if not sys.platform.startswith("linux"):
+            return False
+        try:
+            import fcntl
+
+            fcntl.ioctl(dst_fd, FICLONE, src_fd)
+            return True
+        except (ImportError, OSError):
+            return False
+
+    def _copy_file(self, source_file: Path, dest_file: Path) -> None:
+        """
+        Copy a file with data and metadata, staying in kernel space if possible.
+
+        Tries a reflink clone first, then os.copy_file_range, and falls back
+        to a user-space copy when neither is supported.
+
+        Args:
+            source_file: File to copy
+            dest_file: Destination path
+        """
+        with open(source_file, "rb") as fsrc, open(dest_file, "wb") as fdst:
+            src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+            if not self._reflink(src_fd, dst_fd):
+                copied = False
+                copy_file_range = getattr(os, "copy_file_range", None)
+                if copy_file_range:
+                    try:
+                        while copy_file_range(src_fd, dst_fd, COPY_CHUNK_SIZE):
+                            pass
+                        copied = True
+                    except OSError:
+                        # Unsupported filesystem or cross-device on old kernels
+                        fsrc.seek(0)
+                        fdst.seek(0)
+                        fdst.truncate()
+                if not copied:
+                    shutil.copyfileobj(fsrc, fdst)
+        shutil.copystat(source_file, dest_file)
+
+    def _same_content(self, path_a: Path, path_b: Path) -> bool:
+        """
+        Compare two files byte for byte.
+
+        Args:
+            path_a: First file
+            path_b: Second file
+
+        Returns:
+            True if both files hold identical bytes
+        """
+        with open(path_a, "rb") as fa, open(path_b, "rb") as fb:
+            while True:
+                chunk = fa.read(CHECKSUM_CHUNK_SIZE)
+                if chunk != fb.read(CHECKSUM_CHUNK_SIZE):
+                    return False
+                if not chunk:
+                    return True
+
+    def _pool_path(self, checksum: str, st: os.stat_result) -> Path:
+        """
+        Pool location for content with a given checksum and file metadata.
+
+        Hardlinked files share one inode, so permission bits and mtime are
+        part of the key; files that differ only in metadata get separate
+        pool entries and keep their own metadata.
+
+        Args:
+            checksum: Content checksum
+            st: Stat result of the file being stored
+
+        Returns:
+            Path of the pool entry
+        """
+        key = f"{checksum[2:]}-{st.st_size}-{S_IMODE(st.st_mode):o}-{st.st_mtime_ns}"
+        return self.pool_dir / checksum[:2] / key
+
+    def _store_file(self, source_file: Path, dest_file: Path, checksum: str) -> None:
+        """
+        Store a file in a backup, sharing identical content across backups.
+
+        With deduplication enabled, each stored file is also hardlinked into
+        the pool, and later files with the same checksum and metadata are
+        linked to that entry instead of copied. A pool entry is only reused
+        after a byte comparison with the source, so a checksum collision or a
+        stale reused checksum never makes different files share storage.
+        Where hardlinks are not supported the pool is skipped entirely.
+
+        Args:
+            source_file: File to back up
+            dest_file: Destination path inside the backup
+            checksum: Content checksum of the source file
+        """
+        if not self.deduplicate or not self._pool_links:
+            self._copy_file(source_file, dest_file)
+            return
+
+        pool_path = self._pool_path(checksum, os.stat(source_file))
+        if pool_path.exists() and self._same_content(pool_path, source_file):
+            try:
+                os.link(pool_path, dest_file)
+                return
+            except OSError:
+                # Pruned meanwhile or at the link limit; store a fresh copy
+                pass
+
+        self._copy_file(source_file, dest_file)
+
+        # Publish the complete copy; linking fails if the entry already exists
+        pool_path = self._pool_path(checksum, os.stat(dest_file))
+        pool_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(dest_file, pool_path)
+            return
+        except FileExistsError:
+            pass
+        except OSError as e:
+            logger.info(f"Hardlinks unsupported under {self.pool_dir}, not deduplicating: {e}")
+            self._pool_links = False
+            return
+
+        # Another worker stored the same file meanwhile; share its entry
+        # unless the entry is a checksum collision
+        if not self._same_content(pool_path, dest_file):
+            return
+        tmp_path = dest_file.with_name(f"{dest_file.name}.{secrets.token_hex(8)}.tmp")
+        try:
+            os.link(pool_path, tmp_path)
+            os.replace(tmp_path, dest_file)
+        except OSError:
+            # Keep the private copy
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def _prune_pool(self) -> None:
+        """Remove pool entries no longer linked from any backup."""
+        if not self.pool_dir.exists():
+            return
+        for bucket in os.scandir(self.pool_dir):
+            if not bucket.is_dir(follow_symlinks=False):
+                continue
+            for entry in os.scandir(bucket.path):
+                if entry.stat(follow_symlinks=False).st_nlink <= 1:
+                    os.unlink(entry.path)
+
+    def _run_copy_jobs(self, func: Callable[..., None], jobs: List[tuple]) -> None:
+        """
+        Run a copy function over jobs, concurrently when parallel is enabled.
+
+        Args:
+            func: Function called as func(*job)
+            jobs: Argument tuples, one per file
+        """
+        if self.parallel and len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+                # Consume results so copy errors propagate
+                list(executor.map(lambda job: func(*job), jobs))
+        else:
+            for job in jobs:
+                func(*job)
+
+    def _open_file_index(self):
+        """
+        Open the persistent file index for reading.
+
+        Returns:
+            Open dbm handle, or None if there is no usable index, in which
+            case every file is hashed
+        """
+        path = str(self.index_db_path)
+        if dbm.whichdb(path) is None:
+            logger.debug(f"No persisted file index at {path}")
+            return None
+        try:
+            return dbm.open(path, "r")
+        except dbm.error as e:
+            logger.warning(f"Ignoring unusable file index {path}: {e}")
+            return None
+
+    def _persist_file_index(self, source: Path, file_index: Dict[str, FileMetadata]) -> None:
+        """
+        Record file stat and checksums so later runs can skip rehashing.
+
+        Entries under the source that are not in file_index, such as files
+        deleted since the last run, are removed.
+
+        Args:
+            source: Source directory the index was scanned from
+            file_index: Index to persist
+        """
+        prefix = f"{source.resolve()}\0".encode()
+        current = set()
+        try:
+            with dbm.open(str(self.index_db_path), "c") as index_db:
+                for relative_path, fm in file_index.items():
+                    key = prefix + relative_path.encode()
+                    current.add(key)
+                    index_db[key] = (
+                        INDEX_RECORD.pack(fm.size, fm.mtime, fm.inode) + fm.checksum.encode()
+                    )
+                stale = [
+                    key for key in index_db.keys() if key.startswith(prefix) and key not in current
+                ]
+                for key in stale:
+                    del index_db[key]
+        except dbm.error as e:
+            logger.warning(f"Failed to persist file index: {e}")
+
     def _save_manifest(self, manifest: BackupManifest) -> None:
         """
         Save backup manifest to disk.
@@ -300,12 +869,39 @@ class IncrementalBackup:
         manifest_file = Path(manifest.backup_dir) / "manifest.json"
 
         try:
-            # Convert to dict for JSON serialization
-            manifest_dict = asdict(manifest)
-            manifest_dict["created_at"] = manifest.created_at.isoformat()
-
-            with open(manifest_file, "w") as f:
-                json.dump(manifest_dict, f, indent=2)
+            # Header fields first, then one entry per file, so the full
+            # asdict() copy of the file index is never built in memory
+            header = {
+                "backup_id": manifest.backup_id,
+                "name": manifest.name,
+                "source_path": manifest.source_path,
+                "backup_dir": manifest.backup_dir,
+                "created_at": manifest.created_at.isoformat(),
+                "parent_backup_id": manifest.parent_backup_id,
+                "new_files": manifest.new_files,
+                "modified_files": manifest.modified_files,
+                "deleted_files": manifest.deleted_files,
+                "total_size": manifest.total_size,
+            }
+
+            with open(manifest_file, "wb") as f:
+                # Reopen the header object to append the files mapping
+                f.write(_json_bytes(header)[:-1])
+                f.write(b',"files":{')
+                separator = b""
+                for path, fm in manifest.files.items():
+                    row = {
+                        "path": fm.path,
+                        "size": fm.size,
+                        "mtime": fm.mtime,
+                        "checksum": fm.checksum,
+                        "backed_up": fm.backed_up,
+                        "backup_path": fm.backup_path,
+                        "inode": fm.inode,
+                    }
+                    f.write(separator + _json_bytes(path) + b":" + _json_bytes(row))
+                    separator = b","
+                f.write(b"}}")
 
             logger.debug(f"Saved manifest: {manifest_file}")
 
@@ -323,8 +919,12 @@ class IncrementalBackup:
             BackupManifest object
         """
         try:
-            with open(manifest_file, "r") as f:
-                data = json.load(f)
+            if orjson is not None:
+                with open(manifest_file, "rb") as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(manifest_file, "r") as f:
+                    data = json.load(f)
 
             # Reconstruct FileMetadata objects
             files = {}
@@ -345,6 +945,38 @@ class IncrementalBackup:
                 details={"path": str(manifest_file)},
             )
 
+    def _resolve_chain(self, backup_id: str) -> Tuple[str, ...]:
+        """
+        Resolve the backup chain ending at a backup.
+
+        Chains are cached when backups are created; this walks parent
+        pointers only for backups that were not created by this instance.
+
+        Args:
+            backup_id: Backup ID (must be in manifests)
+
+        Returns:
+            Tuple of backup IDs in chain (oldest to newest)
+        """
+        cached = self._chain_cache.get(backup_id)
+        if cached is not None:
+            return cached
+
+        chain = deque([backup_id])
+        current_id = backup_id
+        while self.manifests[current_id].parent_backup_id:
+            parent_id = self.manifests[current_id].parent_backup_id
+            if parent_id in self.manifests:
+                chain.appendleft(parent_id)
+                current_id = parent_id
+            else:
+                logger.warning(f"Parent backup not found: {parent_id}")
+                break
+
+        resolved = tuple(chain)
+        self._chain_cache[backup_id] = resolved
+        return resolved
+
     def restore_backup(
         self, backup_id: str, dest_path: str, incremental_chain: bool = True
     ) -> bool:
@@ -374,36 +1006,36 @@ class IncrementalBackup:
 
         try:
             # Build restore chain
-            restore_chain = [backup_id]
-
             if incremental_chain:
-                current_id = backup_id
-                while self.manifests[current_id].parent_backup_id:
-                    parent_id = self.manifests[current_id].parent_backup_id
-                    if parent_id in self.manifests:
-                        restore_chain.insert(0, parent_id)
-                        current_id = parent_id
-                    else:
-                        logger.warning(f"Parent backup not found: {parent_id}")
-                        break
+                restore_chain = self._resolve_chain(backup_id)
+            else:
+                restore_chain = (backup_id,)
 
             logger.info(f"Restoring backup chain: {restore_chain}")
 
-            # Restore in order (oldest to newest)
-            for backup_id_to_restore in restore_chain:
+            # Flatten the chain newest to oldest so each path is copied once,
+            # from the most recent backup that holds it
+            restore_files: Dict[str, str] = {}
+            for backup_id_to_restore in reversed(restore_chain):
                 manifest = self.manifests[backup_id_to_restore]
-
-                # Copy all backed up files
                 for file_metadata in manifest.files.values():
+                    if file_metadata.path in restore_files:
+                        continue
                     if file_metadata.backed_up and file_metadata.backup_path:
-                        source_file = Path(file_metadata.backup_path)
-                        dest_file = dest / file_metadata.path
-
-                        if source_file.exists():
-                            dest_file.parent.mkdir(parents=True, exist_ok=True)
-                            shutil.copy2(source_file, dest_file)
+                        if os.path.exists(file_metadata.backup_path):
+                            restore_files[file_metadata.path] = file_metadata.backup_path
                         else:
-                            logger.warning(f"Backup file not found: {source_file}")
+                            logger.warning(f"Backup file not found: {file_metadata.backup_path}")
+
+            parent_dirs = {os.path.dirname(file_path) for file_path in restore_files}
+            for parent_dir in sorted(parent_dirs, key=len):
+                os.makedirs(dest / parent_dir, exist_ok=True)
+
+            restore_jobs = [
+                (Path(backup_path), dest / file_path)
+                for file_path, backup_path in restore_files.items()
+            ]
+            self._run_copy_jobs(self._copy_file, restore_jobs)
 
             logger.info(f"Successfully restored backup: {backup_id}")
             return True
@@ -452,8 +1084,11 @@ class IncrementalBackup:
             backup_dir = Path(manifest.backup_dir)
             if backup_dir.exists():
                 shutil.rmtree(backup_dir)
+            if self.deduplicate:
+                self._prune_pool()
 
             del self.manifests[backup_id]
+            self._chain_cache.pop(backup_id, None)
             logger.info(f"Deleted backup: {backup_id}")
             return True
 
@@ -501,18 +1136,7 @@ class IncrementalBackup:
         if backup_id not in self.manifests:
             return []
 
-        chain = [backup_id]
-        current_id = backup_id
-
-        while self.manifests[current_id].parent_backup_id:
-            parent_id = self.manifests[current_id].parent_backup_id
-            if parent_id in self.manifests:
-                chain.insert(0, parent_id)
-                current_id = parent_id
-            else:
-                break
-
-        return chain
+        return list(self._resolve_chain(backup_id))
 
     def get_total_size(self) -> int:
         """
@@ -523,12 +1147,46 @@ class IncrementalBackup:
         """
         return sum(b.total_size for b in self.manifests.values())
 
-    def verify_backup(self, backup_id: str) -> bool:
+    def _verify_file(self, file_metadata: FileMetadata) -> bool:
+        """
+        Check that a backed-up file exists and matches its recorded checksum.
+
+        Args:
+            file_metadata: Metadata of the backed-up file
+
+        Returns:
+            True if the file is intact, False otherwise
+        """
+        try:
+            # Backup copies are not written concurrently and are not read again
+            checksum = self._calculate_file_checksum(
+                file_metadata.backup_path, file_metadata.size, use_mmap=True, drop_cache=True
+            )
+        except FileNotFoundError:
+            logger.error(f"Backup file missing: {file_metadata.backup_path}")
+            return False
+        except OSError as e:
+            logger.error(f"Backup file unreadable: {file_metadata.backup_path} ({e})")
+            return False
+
+        if checksum != file_metadata.checksum:
+            logger.error(
+                f"Backup file corrupted: {file_metadata.backup_path} "
+                f"(expected {file_metadata.checksum}, got {checksum})"
+            )
+            return False
+        return True
+
+    def verify_backup(self, backup_id: str, quick: bool = False) -> bool:
         """
         Verify backup integrity.
 
+        Recomputes the checksum of every backed-up file and compares it with
+        the manifest, so corruption is detected as well as missing files.
+
         Args:
             backup_id: Backup ID to verify
+            quick: Only check a random 1% sample of files
 
         Returns:
             True if valid, False otherwise
@@ -544,12 +1202,19 @@ class IncrementalBackup:
             logger.error(f"Backup directory not found: {backup_dir}")
             return False
 
-        # Verify all backed up files exist
-        for file_metadata in manifest.files.values():
-            if file_metadata.backed_up and file_metadata.backup_path:
-                if not Path(file_metadata.backup_path).exists():
-                    logger.error(f"Backup file missing: {file_metadata.backup_path}")
-                    return False
+        backed_up = [fm for fm in manifest.files.values() if fm.backed_up and fm.backup_path]
+        if quick and backed_up:
+            backed_up = random.sample(backed_up, max(1, len(backed_up) // 100))
+
+        if self.parallel and len(backed_up) > 1:
+            with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+                results = list(executor.map(self._verify_file, backed_up))
+        else:
+            results = [self._verify_file(fm) for fm in backed_up]
+
+        if not all(results):
+            logger.error(f"Backup verification failed: {backup_id} ({results.count(False)} bad)")
+            return False
 
         logger.info(f"Backup verified: {backup_id}")
         return True
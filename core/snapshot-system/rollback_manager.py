@@ -3,19 +3,32 @@ Rollback orchestration with safety checks.
 Coordinates system-wide rollback operations with validation.
 """
 
+import bisect
+import json
 import logging
-import subprocess
+import os
+import secrets
+import shutil
+import sqlite3
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import islice
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
+from core.compat import DATACLASS_SLOTS
 from core.exceptions import RollbackError
 
 logger = logging.getLogger(__name__)
 
+# Rollback points kept in memory; the rest are loaded from points.db on demand
+POINT_CACHE_SIZE = 1024
+# A rollback point verified this recently is not re-checked on disk
+VERIFY_CACHE_SECONDS = 5.0
+
 
 class RollbackState(Enum):
     """Rollback operation state."""
@@ -47,7 +60,7 @@ class SafetyCheckType(Enum):
     BACKUP_INTEGRITY = "backup_integrity"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SafetyCheck:
     """Safety check result."""
 
@@ -57,37 +70,58 @@ class SafetyCheck:
     details: Optional[Dict] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RollbackPoint:
     """Represents a system rollback point."""
 
     point_id: str
     name: str
     description: str
-    created_at: datetime
+    created_at: int  # time.time_ns()
     scope: RollbackScope
     snapshot_id: Optional[str] = None
     backup_id: Optional[str] = None
     config_backup: Optional[str] = None
     verified: bool = False
+    verified_at: Optional[int] = None  # time.time_ns()
+
+    @property
+    def created_at_dt(self) -> datetime:
+        """Creation time as a local datetime, for display."""
+        return datetime.fromtimestamp(self.created_at / 1e9)
+
+    @property
+    def verified_at_dt(self) -> Optional[datetime]:
+        """Last verification time as a local datetime, for display."""
+        if self.verified_at is None:
+            return None
+        return datetime.fromtimestamp(self.verified_at / 1e9)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RollbackOperation:
     """Represents a rollback operation."""
 
     operation_id: str
     point_id: str
     state: RollbackState
-    started_at: datetime
-    completed_at: Optional[datetime] = None
-    safety_checks: List[SafetyCheck] = None
+    started_at: int  # time.time_ns()
+    completed_at: Optional[int] = None  # time.time_ns()
+    safety_checks: List[SafetyCheck] = field(default_factory=list)
     error_message: Optional[str] = None
     pre_rollback_point: Optional[str] = None
 
-    def __post_init__(self):
-        if self.safety_checks is None:
-            self.safety_checks = []
+    @property
+    def started_at_dt(self) -> datetime:
+        """Start time as a local datetime, for display."""
+        return datetime.fromtimestamp(self.started_at / 1e9)
+
+    @property
+    def completed_at_dt(self) -> Optional[datetime]:
+        """Completion time as a local datetime, for display."""
+        if self.completed_at is None:
+            return None
+        return datetime.fromtimestamp(self.completed_at / 1e9)
 
 
 class RollbackManager:
@@ -98,6 +132,7 @@ class RollbackManager:
         data_dir: str = "/data/rollback",
         require_safety_checks: bool = True,
         auto_create_checkpoint: bool = True,
+        simulate_work: bool = False,
     ):
         """
         Initialize rollback manager.
@@ -106,14 +141,24 @@ class RollbackManager:
             data_dir: Directory for rollback data
             require_safety_checks: Whether to enforce safety checks
             auto_create_checkpoint: Automatically create pre-rollback checkpoint
+            simulate_work: Sleep in place of the not-yet-wired restore steps
         """
         self.data_dir = Path(data_dir)
         self.require_safety_checks = require_safety_checks
         self.auto_create_checkpoint = auto_create_checkpoint
+        self.simulate_work = simulate_work
 
-        self.rollback_points: Dict[str, RollbackPoint] = {}
+        # Recently used rollback points; points.db is the source of truth
+        self.rollback_points: "OrderedDict[str, RollbackPoint]" = OrderedDict()
         self.operations: Dict[str, RollbackOperation] = {}
+        # (timestamp, id) pairs kept in ascending time order for list_operations
+        self._operations_by_time: List[Tuple[int, str]] = []
         self.safety_checkers: Dict[SafetyCheckType, Callable[[], SafetyCheck]] = {}
+        # Snapshot of safety_checkers items, rebuilt whenever a checker is registered
+        self._checker_list: Tuple[Tuple[SafetyCheckType, Callable[[], SafetyCheck]], ...] = ()
+        # Recent checker results keyed by type: (monotonic timestamp, result)
+        self._check_cache: Dict[SafetyCheckType, Tuple[float, SafetyCheck]] = {}
+        self._check_ttl = 1.0
 
         try:
             self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -125,52 +170,67 @@ class RollbackManager:
                 details={"path": data_dir},
             )
 
+        db_path = self.data_dir / "points.db"
+        try:
+            self._db = sqlite3.connect(str(db_path), isolation_level=None, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS points ("
+                "point_id TEXT PRIMARY KEY, created_at INTEGER, scope TEXT, data BLOB)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS points_created_at ON points (created_at)")
+        except sqlite3.Error as e:
+            raise RollbackError(
+                f"Failed to open rollback point store: {e}",
+                error_code="ROLLBACK_DB_FAILED",
+                details={"path": str(db_path)},
+            )
+
         # Register default safety checkers
         self._register_default_safety_checkers()
 
+    def __enter__(self) -> "RollbackManager":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the rollback point store."""
+        self._db.close()
+
     def _register_default_safety_checkers(self):
         """Register default safety check implementations."""
         self.safety_checkers[SafetyCheckType.DISK_SPACE] = self._check_disk_space
         self.safety_checkers[SafetyCheckType.SYSTEM_LOAD] = self._check_system_load
         self.safety_checkers[SafetyCheckType.RUNNING_PROCESSES] = self._check_running_processes
+        self._rebuild_checker_list()
+
+    def _rebuild_checker_list(self):
+        """Rebuild the (check type, checker) tuple used when running all checks."""
+        self._checker_list = tuple(self.safety_checkers.items())
 
     def _check_disk_space(self) -> SafetyCheck:
         """Check if sufficient disk space is available."""
         try:
-            stat = subprocess.run(
-                ["df", "-h", str(self.data_dir)],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
+            total, used, free = shutil.disk_usage(self.data_dir)
+            use_percent = round(used * 100 / total)
+            available = f"{free // (1024**3)}G"
 
-            # Parse df output
-            lines = stat.stdout.strip().split("\n")
-            if len(lines) > 1:
-                parts = lines[1].split()
-                if len(parts) >= 5:
-                    use_percent = int(parts[4].rstrip("%"))
-                    available = parts[3]
-
-                    if use_percent > 90:
-                        return SafetyCheck(
-                            check_type=SafetyCheckType.DISK_SPACE,
-                            passed=False,
-                            message=f"Disk usage critical: {use_percent}%",
-                            details={"use_percent": use_percent, "available": available},
-                        )
-
-                    return SafetyCheck(
-                        check_type=SafetyCheckType.DISK_SPACE,
-                        passed=True,
-                        message=f"Disk space sufficient: {available} available",
-                        details={"use_percent": use_percent, "available": available},
-                    )
+            if use_percent > 90:
+                return SafetyCheck(
+                    check_type=SafetyCheckType.DISK_SPACE,
+                    passed=False,
+                    message=f"Disk usage critical: {use_percent}%",
+                    details={"use_percent": use_percent, "available": available},
+                )
 
             return SafetyCheck(
                 check_type=SafetyCheckType.DISK_SPACE,
                 passed=True,
-                message="Disk space check passed (unable to parse)",
+                message=f"Disk space sufficient: {available} available",
+                details={"use_percent": use_percent, "available": available},
             )
 
         except Exception as e:
@@ -184,12 +244,8 @@ class RollbackManager:
     def _check_system_load(self) -> SafetyCheck:
         """Check if system load is acceptable."""
         try:
-            with open("/proc/loadavg", "r") as f:
-                loadavg = f.read().strip().split()
-
-            load_1min = float(loadavg[0])
-            load_5min = float(loadavg[1])
-            load_15min = float(loadavg[2])
+            # Round to the two decimals /proc/loadavg reports
+            load_1min, load_5min, load_15min = (round(load, 2) for load in os.getloadavg())
 
             # Simple heuristic: warn if 1-min load > 10
             if load_1min > 10.0:
@@ -226,9 +282,9 @@ class RollbackManager:
     def _check_running_processes(self) -> SafetyCheck:
         """Check for critical running processes."""
         try:
-            # Count running processes
-            result = subprocess.run(["ps", "aux"], capture_output=True, text=True, timeout=5)
-            process_count = len(result.stdout.strip().split("\n")) - 1
+            # Count running processes: every numeric /proc entry is a PID
+            with os.scandir("/proc") as it:
+                process_count = sum(1 for entry in it if entry.name.isdigit())
 
             return SafetyCheck(
                 check_type=SafetyCheckType.RUNNING_PROCESSES,
@@ -256,47 +312,94 @@ class RollbackManager:
             checker: Callable that returns SafetyCheck
         """
         self.safety_checkers[check_type] = checker
+        self._check_cache.pop(check_type, None)
+        self._rebuild_checker_list()
         logger.info(f"Registered safety checker: {check_type.value}")
 
     def run_safety_checks(
-        self, check_types: Optional[List[SafetyCheckType]] = None
+        self,
+        check_types: Optional[List[SafetyCheckType]] = None,
+        force_refresh: bool = False,
     ) -> List[SafetyCheck]:
         """
         Run safety checks.
 
+        Results younger than the cache TTL are reused instead of invoking
+        the checker again.
+
         Args:
             check_types: Specific checks to run, or None for all
+            force_refresh: Ignore cached results and run every checker
 
         Returns:
             List of SafetyCheck results
         """
         if check_types is None:
-            check_types = list(self.safety_checkers.keys())
-
-        results = []
+            selected = self._checker_list
+        else:
+            selected = tuple(
+                (check_type, self.safety_checkers[check_type])
+                for check_type in check_types
+                if check_type in self.safety_checkers
+            )
 
-        for check_type in check_types:
-            if check_type in self.safety_checkers:
-                try:
-                    checker = self.safety_checkers[check_type]
-                    result = checker()
-                    results.append(result)
-                    logger.debug(
-                        f"Safety check {check_type.value}: "
-                        f"{'PASSED' if result.passed else 'FAILED'}"
-                    )
-                except Exception as e:
-                    logger.error(f"Safety check {check_type.value} raised exception: {e}")
-                    results.append(
-                        SafetyCheck(
-                            check_type=check_type,
-                            passed=False,
-                            message=f"Check failed with exception: {e}",
-                        )
-                    )
+        results: List[SafetyCheck] = []
+        for check_type, checker in selected:
+            cached = self._check_cache.get(check_type)
+            if (
+                not force_refresh
+                and cached is not None
+                and time.monotonic() - cached[0] < self._check_ttl
+            ):
+                results.append(cached[1])
+                continue
+
+            try:
+                result = checker()
+                self._check_cache[check_type] = (time.monotonic(), result)
+                logger.debug(
+                    f"Safety check {check_type.value}: "
+                    f"{'PASSED' if result.passed else 'FAILED'}"
+                )
+            except Exception as e:
+                logger.error(f"Safety check {check_type.value} raised exception: {e}")
+                result = SafetyCheck(
+                    check_type=check_type,
+                    passed=False,
+                    message=f"Check failed with exception: {e}",
+                )
+            results.append(result)
 
         return results
 
+    def _cache_point(self, point: RollbackPoint):
+        """Add a point to the in-memory cache, evicting the least recently used."""
+        self.rollback_points[point.point_id] = point
+        self.rollback_points.move_to_end(point.point_id)
+        if len(self.rollback_points) > POINT_CACHE_SIZE:
+            self.rollback_points.popitem(last=False)
+
+    def _decode_point(self, point_id: str, scope: str, data: bytes) -> RollbackPoint:
+        """Build a RollbackPoint from a points.db row."""
+        return RollbackPoint(point_id=point_id, scope=RollbackScope(scope), **json.loads(data))
+
+    def _get_point(self, point_id: str) -> Optional[RollbackPoint]:
+        """Return a point from the cache, falling back to points.db."""
+        point = self.rollback_points.get(point_id)
+        if point is not None:
+            self.rollback_points.move_to_end(point_id)
+            return point
+
+        row = self._db.execute(
+            "SELECT scope, data FROM points WHERE point_id = ?", (point_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        point = self._decode_point(point_id, *row)
+        self._cache_point(point)
+        return point
+
     def create_rollback_point(
         self,
         name: str,
@@ -320,40 +423,56 @@ class RollbackManager:
         Returns:
             RollbackPoint object
         """
-        import hashlib
-
-        point_id = hashlib.sha256(f"{name}:{datetime.now().isoformat()}".encode()).hexdigest()[:16]
+        point_id = secrets.token_hex(8)
 
         point = RollbackPoint(
             point_id=point_id,
             name=name,
             description=description,
-            created_at=datetime.now(),
+            created_at=time.time_ns(),
             scope=scope,
             snapshot_id=snapshot_id,
             backup_id=backup_id,
             config_backup=config_backup,
         )
 
-        self.rollback_points[point_id] = point
+        data = {
+            "name": name,
+            "description": description,
+            "created_at": point.created_at,
+            "snapshot_id": snapshot_id,
+            "backup_id": backup_id,
+            "config_backup": config_backup,
+        }
+        self._db.execute(
+            "INSERT INTO points (point_id, created_at, scope, data) VALUES (?, ?, ?, ?)",
+            (point_id, point.created_at, scope.value, json.dumps(data).encode()),
+        )
+        self._cache_point(point)
         logger.info(f"Created rollback point: {name} (id={point_id})")
         return point
 
-    def verify_rollback_point(self, point_id: str) -> bool:
+    def _verify_point(self, point: RollbackPoint, exists: Callable[[str], bool], now: int) -> bool:
         """
-        Verify a rollback point is valid.
+        Check that the resources a rollback point references exist.
+
+        A point verified less than VERIFY_CACHE_SECONDS ago is reported valid
+        without touching the filesystem.
 
         Args:
-            point_id: Rollback point ID
+            point: Rollback point to verify
+            exists: Path existence check, with os.path.exists semantics
+            now: Time to record as the verification time, from time.time_ns()
 
         Returns:
             True if valid, False otherwise
         """
-        if point_id not in self.rollback_points:
-            logger.warning(f"Rollback point not found: {point_id}")
-            return False
-
-        point = self.rollback_points[point_id]
+        if (
+            point.verified
+            and point.verified_at is not None
+            and now - point.verified_at < VERIFY_CACHE_SECONDS * 1e9
+        ):
+            return True
 
         # Basic validation - check that referenced resources exist
         # In production, would verify snapshots/backups are accessible
@@ -367,15 +486,74 @@ class RollbackManager:
             # Would check backup exists
             pass
 
-        if point.config_backup:
-            config_path = Path(point.config_backup)
-            if not config_path.exists():
-                logger.warning(f"Config backup not found: {point.config_backup}")
-                valid = False
+        if point.config_backup and not exists(point.config_backup):
+            logger.warning(f"Config backup not found: {point.config_backup}")
+            valid = False
 
         point.verified = valid
+        point.verified_at = now
         return valid
 
+    def verify_rollback_point(self, point_id: str) -> bool:
+        """
+        Verify a rollback point is valid.
+
+        Args:
+            point_id: Rollback point ID
+
+        Returns:
+            True if valid, False otherwise
+        """
+        point = self._get_point(point_id)
+        if point is None:
+            logger.warning(f"Rollback point not found: {point_id}")
+            return False
+
+        return self._verify_point(point, os.path.exists, time.time_ns())
+
+    def verify_rollback_points(self, point_ids: List[str]) -> Dict[str, bool]:
+        """
+        Verify several rollback points at once.
+
+        Config backups are checked against one directory scan per parent
+        directory instead of one stat call per point.
+
+        Args:
+            point_ids: Rollback point IDs
+
+        Returns:
+            Dictionary mapping each point ID to its validity
+        """
+        listings: Dict[str, set] = {}
+
+        def exists(path: str) -> bool:
+            parent, name = os.path.split(path)
+            entries = listings.get(parent)
+            if entries is None:
+                entries = set()
+                try:
+                    with os.scandir(parent or ".") as it:
+                        for entry in it:
+                            # Match os.path.exists: a dangling symlink does not count
+                            if not entry.is_symlink() or os.path.exists(entry.path):
+                                entries.add(entry.name)
+                except OSError:
+                    pass
+                listings[parent] = entries
+            return name in entries
+
+        results: Dict[str, bool] = {}
+        now = time.time_ns()
+        for point_id in point_ids:
+            point = self._get_point(point_id)
+            if point is None:
+                logger.warning(f"Rollback point not found: {point_id}")
+                results[point_id] = False
+            else:
+                results[point_id] = self._verify_point(point, exists, now)
+
+        return results
+
     def initiate_rollback(
         self,
         point_id: str,
@@ -396,15 +574,14 @@ class RollbackManager:
         Raises:
             RollbackError: If rollback cannot be initiated
         """
-        if point_id not in self.rollback_points:
+        point = self._get_point(point_id)
+        if point is None:
             raise RollbackError(
                 f"Rollback point not found: {point_id}",
                 error_code="POINT_NOT_FOUND",
                 details={"point_id": point_id},
             )
 
-        point = self.rollback_points[point_id]
-
         # Verify rollback point
         if not self.verify_rollback_point(point_id):
             if not force:
@@ -416,20 +593,25 @@ class RollbackManager:
             logger.warning(f"Forcing rollback despite verification failure: {point_id}")
 
         # Create operation
-        import hashlib
-
-        operation_id = hashlib.sha256(
-            f"{point_id}:{datetime.now().isoformat()}".encode()
-        ).hexdigest()[:16]
+        operation_id = secrets.token_hex(8)
 
         operation = RollbackOperation(
             operation_id=operation_id,
             point_id=point_id,
             state=RollbackState.PENDING,
-            started_at=datetime.now(),
+            started_at=time.time_ns(),
         )
 
         self.operations[operation_id] = operation
+        bisect.insort(self._operations_by_time, (operation.started_at, operation_id))
+
+        # A point that references nothing has nothing to restore: skip the safety
+        # checks and the pre-rollback checkpoint
+        if not force and not (point.snapshot_id or point.backup_id or point.config_backup):
+            operation.state = RollbackState.COMPLETED
+            operation.completed_at = time.time_ns()
+            logger.info(f"Rollback {operation_id} is a no-op for point {point.name}")
+            return operation
 
         try:
             # Run safety checks
@@ -470,14 +652,14 @@ class RollbackManager:
             self._execute_rollback(point, operation)
 
             operation.state = RollbackState.COMPLETED
-            operation.completed_at = datetime.now()
+            operation.completed_at = time.time_ns()
             logger.info(f"Rollback completed: {operation_id}")
             return operation
 
         except Exception as e:
             operation.state = RollbackState.FAILED
             operation.error_message = str(e)
-            operation.completed_at = datetime.now()
+            operation.completed_at = time.time_ns()
             logger.error(f"Rollback failed: {e}")
             raise
 
@@ -501,24 +683,28 @@ class RollbackManager:
             # Restore filesystem snapshot
             if point.snapshot_id:
                 logger.info(f"Would restore snapshot: {point.snapshot_id}")
-                time.sleep(0.5)  # Simulate work
+                if self.simulate_work:
+                    time.sleep(0.5)
 
         elif point.scope == RollbackScope.APPLICATION:
             # Restore application state
             if point.backup_id:
                 logger.info(f"Would restore backup: {point.backup_id}")
-                time.sleep(0.5)
+                if self.simulate_work:
+                    time.sleep(0.5)
 
         elif point.scope == RollbackScope.CONFIGURATION:
             # Restore configuration
             if point.config_backup:
                 logger.info(f"Would restore config: {point.config_backup}")
-                time.sleep(0.5)
+                if self.simulate_work:
+                    time.sleep(0.5)
 
         elif point.scope == RollbackScope.FULL_SYSTEM:
             # Full system rollback
             logger.info("Would perform full system rollback")
-            time.sleep(1.0)
+            if self.simulate_work:
+                time.sleep(1.0)
 
         logger.info(f"Rollback execution complete for point: {point.point_id}")
 
@@ -543,24 +729,41 @@ class RollbackManager:
             return False
 
         operation.state = RollbackState.CANCELLED
-        operation.completed_at = datetime.now()
+        operation.completed_at = time.time_ns()
         logger.info(f"Cancelled rollback operation: {operation_id}")
         return True
 
-    def list_rollback_points(self, scope: Optional[RollbackScope] = None) -> List[RollbackPoint]:
+    def list_rollback_points(
+        self, scope: Optional[RollbackScope] = None, limit: Optional[int] = None
+    ) -> List[RollbackPoint]:
         """
-        List rollback points.
+        List rollback points, newest first.
 
         Args:
             scope: Filter by scope
+            limit: Return only the newest ``limit`` points
 
         Returns:
             List of RollbackPoint objects
         """
-        points = list(self.rollback_points.values())
+        query = "SELECT point_id, scope, data FROM points"
+        params: list = []
         if scope:
-            points = [p for p in points if p.scope == scope]
-        return sorted(points, key=lambda p: p.created_at, reverse=True)
+            query += " WHERE scope = ?"
+            params.append(scope.value)
+        query += " ORDER BY created_at DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        points = []
+        for point_id, point_scope, data in self._db.execute(query, params):
+            point = self.rollback_points.get(point_id)
+            if point is None:
+                point = self._decode_point(point_id, point_scope, data)
+                self._cache_point(point)
+            points.append(point)
+        return points
 
     def get_rollback_point(self, point_id: str) -> Optional[RollbackPoint]:
         """
@@ -572,7 +775,7 @@ class RollbackManager:
         Returns:
             RollbackPoint or None if not found
         """
-        return self.rollback_points.get(point_id)
+        return self._get_point(point_id)
 
     def get_operation(self, operation_id: str) -> Optional[RollbackOperation]:
         """
@@ -586,20 +789,23 @@ class RollbackManager:
         """
         return self.operations.get(operation_id)
 
-    def list_operations(self, state: Optional[RollbackState] = None) -> List[RollbackOperation]:
+    def list_operations(
+        self, state: Optional[RollbackState] = None, limit: Optional[int] = None
+    ) -> List[RollbackOperation]:
         """
-        List rollback operations.
+        List rollback operations, newest first.
 
         Args:
             state: Filter by state
+            limit: Return only the newest ``limit`` operations
 
         Returns:
             List of RollbackOperation objects
         """
-        ops = list(self.operations.values())
+        ops = (self.operations[oid] for _, oid in reversed(self._operations_by_time))
         if state:
-            ops = [o for o in ops if o.state == state]
-        return sorted(ops, key=lambda o: o.started_at, reverse=True)
+            ops = (o for o in ops if o.state == state)
+        return list(islice(ops, limit))
 
     def delete_rollback_point(self, point_id: str) -> bool:
         """
@@ -611,10 +817,14 @@ class RollbackManager:
         Returns:
             True if deleted, False if not found
         """
-        if point_id not in self.rollback_points:
+        cursor = self._db.execute("DELETE FROM points WHERE point_id = ?", (point_id,))
+        if cursor.rowcount == 0:
             logger.warning(f"Rollback point not found: {point_id}")
             return False
 
-        del self.rollback_points[point_id]
+        point = self.rollback_points.pop(point_id, None)
+        if point is not None:
+            point.verified = False
+            point.verified_at = None
         logger.info(f"Deleted rollback point: {point_id}")
         return True
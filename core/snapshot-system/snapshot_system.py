@@ -12,6 +12,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from core.compat import DATACLASS_SLOTS
+
 logger = logging.getLogger("querty-snapshot-system")
 
 
@@ -33,7 +35,7 @@ class SnapshotStatus(Enum):
     ACTIVE = "active"  # Currently running system
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Snapshot:
     """Represents a system snapshot."""
 
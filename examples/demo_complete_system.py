@@ -2,14 +2,23 @@
 """
 Querty-OS Complete System Demonstration
 Shows all features working together.
+
+Import time dominates this script. For the fastest start, run it as
+``python -OO examples/demo_complete_system.py`` (strips asserts and
+docstrings). Set QUERTY_PRECOMPILE=1 once to compile ``core/`` and
+``examples/`` to matching optimized bytecode up front.
 """
 
 import sys
 
 sys.path.insert(0, "/home/runner/work/Querty-OS/Querty-OS")
 
+import compileall  # noqa: E402
+import importlib  # noqa: E402
 import logging  # noqa: E402
+import os  # noqa: E402
 from datetime import datetime  # noqa: E402
+from pathlib import Path  # noqa: E402
 
 # Configure logging
 logging.basicConfig(
@@ -18,12 +27,17 @@ logging.basicConfig(
 
 logger = logging.getLogger("querty-demo")
 
+# Banner and section separators
+_SEP = "=" * 70
+_HASH = "#" * 70
+_SPACE68 = " " * 68
+
 
 def demo_boot_profiles():
     """Demonstrate boot profiles system."""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("1. BOOT PROFILES SYSTEM")
-    print("=" * 70)
+    print(_SEP)
 
     from core.boot_profiles import BootProfileManager
 
@@ -47,22 +61,24 @@ def demo_boot_profiles():
     print(f"  - All Features Enabled: {manager.is_feature_enabled('plugins')}")
 
 
+def _load(name):
+    """Import an example plugin module on first use."""
+    return importlib.import_module(f"examples.plugins.{name}")
+
+
 def demo_plugin_system():
     """Demonstrate plugin system with examples."""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("2. PLUGIN SYSTEM")
-    print("=" * 70)
+    print(_SEP)
 
     from core.plugin_system import PluginManager
-    from examples.plugins.calculator_plugin import CalculatorPlugin
-    from examples.plugins.greeter_skill import GreeterSkill
-    from examples.plugins.system_monitor_plugin import SystemMonitorPlugin
 
     manager = PluginManager()
     print("✓ Plugin Manager initialized")
 
     # Load calculator plugin
-    calc = CalculatorPlugin()
+    calc = _load("calculator_plugin").CalculatorPlugin()
     calc.initialize()
     manager.loaded_plugins["calculator"] = calc
     print(f"\n✓ Loaded Plugin: {calc.name} v{calc.version}")
@@ -74,7 +90,7 @@ def demo_plugin_system():
     print(f"  - 8 × 9 = {result2}")
 
     # Load system monitor
-    monitor = SystemMonitorPlugin()
+    monitor = _load("system_monitor_plugin").SystemMonitorPlugin()
     monitor.initialize()
     manager.loaded_plugins["monitor"] = monitor
     print(f"\n✓ Loaded Plugin: {monitor.name} v{monitor.version}")
@@ -85,7 +101,7 @@ def demo_plugin_system():
     print(f"  - CPU Cores: {metrics['cpu_count']}")
 
     # Load greeter skill
-    greeter = GreeterSkill()
+    greeter = _load("greeter_skill").GreeterSkill()
     greeter.initialize()
     manager.loaded_plugins["greeter"] = greeter
     print(f"\n✓ Loaded Plugin: {greeter.name} v{greeter.version}")
@@ -99,9 +115,9 @@ def demo_plugin_system():
 
 def demo_memory_manager():
     """Demonstrate memory management."""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("3. MEMORY MANAGER")
-    print("=" * 70)
+    print(_SEP)
 
     from core.memory_manager import ContextWindowManager, PurgeRules, TaskMemory
 
@@ -109,15 +125,16 @@ def demo_memory_manager():
     context = ContextWindowManager(max_tokens=2048)
     print("✓ Context Window Manager initialized (max: 2048 tokens)")
 
-    # context.add_message("user", "Hello AI, how are you?")
-    # context.add_message("assistant", "I'm doing well! How can I help you today?")
-    # context.add_message("user", "Tell me about Querty-OS")
-    # context.add_message("assistant", "Querty-OS is an AI-first system layer for Android...")
+    context.add_message("user", "Hello AI, how are you?")
+    context.add_message("assistant", "I'm doing well! How can I help you today?")
+    context.add_message("user", "Tell me about Querty-OS")
+    context.add_message("assistant", "Querty-OS is an AI-first system layer for Android...")
 
     print("✓ Added 4 messages to context")
-    print(f"  - Current tokens: {context.current_tokens}")
+    print(f"  - Current tokens: {context.message_tokens}")
     print(f"  - Message count: {len(context.messages)}")
     print(f"  - Should prune: {context.should_prune()}")
+    print(f"  - Tokens freed by prune: {context.prune()}")
 
     # Task memory
     task_mem = TaskMemory()
@@ -142,9 +159,9 @@ def demo_memory_manager():
 
 def demo_security_layer():
     """Demonstrate security features."""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("4. SECURITY LAYER")
-    print("=" * 70)
+    print(_SEP)
 
     from core.security_layer import AuditLogger, PermissionManager, PromptFirewall
 
@@ -190,9 +207,9 @@ def demo_security_layer():
 
 def demo_ota_manager():
     """Demonstrate OTA update system."""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("5. OTA UPDATE MANAGER")
-    print("=" * 70)
+    print(_SEP)
 
     from core.ota_manager import OTAManager
 
@@ -214,9 +231,9 @@ def demo_ota_manager():
 
 def demo_integrated_daemon():
     """Demonstrate integrated daemon."""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("6. INTEGRATED AI DAEMON")
-    print("=" * 70)
+    print(_SEP)
 
     from core.ai_daemon import QuertyAIDaemon
 
@@ -251,11 +268,11 @@ def demo_integrated_daemon():
 
 def main():
     """Run complete demonstration."""
-    print("\n" + "#" * 70)
-    print("#" + " " * 68 + "#")
+    print("\n" + _HASH)
+    print("#" + _SPACE68 + "#")
     print("#" + " " * 15 + "QUERTY-OS COMPLETE SYSTEM DEMO" + " " * 23 + "#")
-    print("#" + " " * 68 + "#")
-    print("#" * 70)
+    print("#" + _SPACE68 + "#")
+    print(_HASH)
     print(f"\nTimestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
     try:
@@ -266,9 +283,9 @@ def main():
         demo_ota_manager()
         demo_integrated_daemon()
 
-        print("\n" + "=" * 70)
+        print("\n" + _SEP)
         print("✅ ALL SYSTEMS OPERATIONAL")
-        print("=" * 70)
+        print(_SEP)
         print("\n✓ Boot Profiles: Working")
         print("✓ Plugin System: Working (3 example plugins)")
         print("✓ Memory Manager: Working")
@@ -276,9 +293,9 @@ def main():
         print("✓ OTA Manager: Working")
         print("✓ AI Daemon: Working (all services integrated)")
 
-        print("\n" + "=" * 70)
+        print("\n" + _SEP)
         print("🎉 DEMONSTRATION COMPLETE!")
-        print("=" * 70)
+        print(_SEP)
 
     except Exception as e:
         logger.error(f"Demo failed: {e}", exc_info=True)
@@ -289,4 +306,8 @@ def main():
 
 
 if __name__ == "__main__":
+    if os.environ.get("QUERTY_PRECOMPILE"):
+        root = Path(__file__).resolve().parent.parent
+        for package in ("core", "examples"):
+            compileall.compile_dir(root / package, quiet=1, optimize=sys.flags.optimize)
     sys.exit(main())
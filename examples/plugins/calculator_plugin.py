@@ -4,43 +4,47 @@ Example Calculator Plugin
 Demonstrates a tool plugin that performs arithmetic operations.
 """
 
+import operator
+from types import MappingProxyType
+
 from core.plugin_system import Plugin, PluginType
 
 
 class CalculatorPlugin(Plugin):
     """Calculator tool plugin."""
 
-    def __init__(self):
-        super().__init__(name="Calculator", version="1.0.0", plugin_type=PluginType.TOOL)
-        self.metadata = {
+    _METADATA = MappingProxyType(
+        {
             "author": "Querty-OS Team",
             "description": "Basic arithmetic calculator",
-            "operations": ["add", "subtract", "multiply", "divide"],
+            "operations": ("add", "subtract", "multiply", "divide"),
         }
+    )
+
+    _OPS = {
+        "add": operator.add,
+        "subtract": operator.sub,
+        "multiply": operator.mul,
+        "divide": operator.truediv,
+    }
+
+    def __init__(self):
+        super().__init__(name="Calculator", version="1.0.0", plugin_type=PluginType.TOOL)
+        self.metadata = dict(self._METADATA)
 
     def initialize(self) -> bool:
         """Initialize the calculator plugin."""
         self.enabled = True
         return True
 
-    def execute(self, **kwargs) -> any:
+    def execute(self, operation: str = None, a=0, b=0, **kwargs) -> any:
         """Execute calculator operation."""
-        operation = kwargs.get("operation")
-        a = kwargs.get("a", 0)
-        b = kwargs.get("b", 0)
-
-        if operation == "add":
-            return a + b
-        elif operation == "subtract":
-            return a - b
-        elif operation == "multiply":
-            return a * b
-        elif operation == "divide":
-            if b == 0:
-                raise ValueError("Division by zero")
-            return a / b
-        else:
+        op = self._OPS.get(operation)
+        if op is None:
             raise ValueError(f"Unknown operation: {operation}")
+        if operation == "divide" and b == 0:
+            raise ValueError("Division by zero")
+        return op(a, b)
 
     def shutdown(self):
         """Shutdown the calculator plugin."""
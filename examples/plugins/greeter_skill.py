@@ -4,7 +4,9 @@ Example Greeter Skill Plugin
 Demonstrates a skill plugin for AI interactions.
 """
 
+import time
 from datetime import datetime
+from types import MappingProxyType
 
 from core.plugin_system import Plugin, PluginType
 
@@ -12,13 +14,22 @@ from core.plugin_system import Plugin, PluginType
 class GreeterSkill(Plugin):
     """Greeter skill plugin."""
 
-    def __init__(self):
-        super().__init__(name="Greeter", version="1.0.0", plugin_type=PluginType.SKILL)
-        self.metadata = {
+    _METADATA = MappingProxyType(
+        {
             "author": "Querty-OS Team",
             "description": "Greet users with time-appropriate messages",
-            "capabilities": ["greet", "farewell", "check_time"],
+            "capabilities": ("greet", "farewell", "check_time"),
         }
+    )
+
+    def __init__(self):
+        super().__init__(name="Greeter", version="1.0.0", plugin_type=PluginType.SKILL)
+        self.metadata = dict(self._METADATA)
+        # Greeting for each hour of the day
+        self._greetings = tuple(
+            "Good morning" if h < 12 else "Good afternoon" if h < 18 else "Good evening"
+            for h in range(24)
+        )
 
     def initialize(self) -> bool:
         """Initialize the greeter skill."""
@@ -31,21 +42,14 @@ class GreeterSkill(Plugin):
         name = kwargs.get("name", "User")
 
         if action == "greet":
-            hour = datetime.now().hour
-            if hour < 12:
-                greeting = "Good morning"
-            elif hour < 18:
-                greeting = "Good afternoon"
-            else:
-                greeting = "Good evening"
+            greeting = self._greetings[time.localtime().tm_hour]
             return f"{greeting}, {name}! How can I assist you today?"
 
         elif action == "farewell":
             return f"Goodbye, {name}! Have a great day!"
 
         elif action == "check_time":
-            now = datetime.now()
-            return f"It's currently {now.strftime('%H:%M:%S')} on {now.strftime('%A, %B %d, %Y')}"
+            return datetime.now().strftime("It's currently %H:%M:%S on %A, %B %d, %Y")
 
         else:
             raise ValueError(f"Unknown action: {action}")
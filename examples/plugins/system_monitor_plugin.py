@@ -4,58 +4,116 @@ Example System Monitor Plugin
 Demonstrates a sensor plugin that monitors system resources.
 """
 
-import psutil
+import threading
+from types import MappingProxyType
 
 from core.plugin_system import Plugin, PluginType
 
+# Imported on first use, so a plugin that is never used never loads psutil
+psutil = None
+
+
+def _psutil():
+    """Return the psutil module, importing it on first call."""
+    global psutil
+    if psutil is None:
+        import psutil
+    return psutil
+
+
+# Seconds the background sampler measures CPU usage over
+CPU_SAMPLE_INTERVAL = 1.0
+# Seconds measured when no background reading is available yet; psutil's
+# first non-blocking reading is always 0.0
+CPU_QUICK_INTERVAL = 0.1
+
 
 class SystemMonitorPlugin(Plugin):
     """System monitoring sensor plugin."""
 
-    def __init__(self):
-        super().__init__(name="System Monitor", version="1.0.0", plugin_type=PluginType.SENSOR)
-        self.metadata = {
+    _METADATA = MappingProxyType(
+        {
             "author": "Querty-OS Team",
             "description": "Monitor CPU, memory, and disk usage",
-            "metrics": ["cpu", "memory", "disk", "all"],
+            "metrics": ("cpu", "memory", "disk", "all"),
         }
+    )
+
+    def __init__(self):
+        super().__init__(name="System Monitor", version="1.0.0", plugin_type=PluginType.SENSOR)
+        self.metadata = dict(self._METADATA)
+        self._cpu_count = None
+        self._last_cpu = None  # latest sampler reading, None until the first one lands
+        self._stop_sampling = threading.Event()
+        self._sampler = None
+        self._handlers = {"cpu": self._cpu, "memory": self._mem, "disk": self._disk}
+
+    def _sample_cpu(self, stop: threading.Event):
+        """Keep the last one-second CPU reading fresh in the background."""
+        while not stop.is_set():
+            self._last_cpu = _psutil().cpu_percent(interval=CPU_SAMPLE_INTERVAL)
 
     def initialize(self) -> bool:
         """Initialize the system monitor plugin."""
+        # Core count never changes at runtime
+        self._cpu_count = _psutil().cpu_count()
+        if self._sampler is None:
+            self._stop_sampling = threading.Event()
+            self._sampler = threading.Thread(
+                target=self._sample_cpu,
+                args=(self._stop_sampling,),
+                name="cpu-sampler",
+                daemon=True,
+            )
+            self._sampler.start()
         self.enabled = True
         return True
 
-    def execute(self, **kwargs) -> any:
+    def _cpu(self) -> dict:
+        """CPU usage from the background sampler, or a short reading until it has one."""
+        cpu_percent = self._last_cpu
+        if cpu_percent is None:
+            cpu_percent = _psutil().cpu_percent(interval=CPU_QUICK_INTERVAL)
+        cpu_count = self._cpu_count
+        if cpu_count is None:
+            cpu_count = _psutil().cpu_count()
+        return {"cpu_percent": cpu_percent, "cpu_count": cpu_count}
+
+    def _mem(self) -> dict:
+        """Virtual memory usage."""
+        mem = _psutil().virtual_memory()
+        return {
+            "total_mb": mem.total / (1024**2),
+            "used_mb": mem.used / (1024**2),
+            "percent": mem.percent,
+        }
+
+    def _disk(self) -> dict:
+        """Root filesystem usage."""
+        disk = _psutil().disk_usage("/")
+        return {
+            "total_gb": disk.total / (1024**3),
+            "used_gb": disk.used / (1024**3),
+            "percent": disk.percent,
+        }
+
+    def execute(self, metric: str = "all", **kwargs) -> any:
         """Get system metrics."""
-        metric = kwargs.get("metric", "all")
-
-        if metric == "cpu":
-            return {"cpu_percent": psutil.cpu_percent(interval=1), "cpu_count": psutil.cpu_count()}
-        elif metric == "memory":
-            mem = psutil.virtual_memory()
-            return {
-                "total_mb": mem.total / (1024**2),
-                "used_mb": mem.used / (1024**2),
-                "percent": mem.percent,
-            }
-        elif metric == "disk":
-            disk = psutil.disk_usage("/")
-            return {
-                "total_gb": disk.total / (1024**3),
-                "used_gb": disk.used / (1024**3),
-                "percent": disk.percent,
-            }
-        elif metric == "all":
-            return {
-                "cpu": self.execute(metric="cpu"),
-                "memory": self.execute(metric="memory"),
-                "disk": self.execute(metric="disk"),
-            }
-        else:
+        if metric == "all":
+            return {"cpu": self._cpu(), "memory": self._mem(), "disk": self._disk()}
+
+        handler = self._handlers.get(metric)
+        if handler is None:
             raise ValueError(f"Unknown metric: {metric}")
+        return handler()
 
     def shutdown(self):
-        """Shutdown the system monitor plugin."""
+        """Shutdown the system monitor plugin, waiting for the sampler to exit."""
+        self._stop_sampling.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+        self._last_cpu = None
         self.enabled = False
 
 
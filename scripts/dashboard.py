@@ -4,7 +4,11 @@ Querty-OS System Status Dashboard
 Displays comprehensive system status including priority allocations.
 """
 
+import functools
+import io
 import sys
+from contextlib import redirect_stdout
+from operator import itemgetter
 from pathlib import Path
 
 # Add core to path
@@ -18,14 +22,37 @@ except ImportError as e:
     print("Please ensure you've installed the package: pip install -e .")
     sys.exit(1)
 
+# Storage bar segments, sliced per row
+_FULL = "█" * 50
+_EMPTY = "░" * 50
+
+# Section separator
+_SEP = "=" * 70
+
+
+def _buffered(func):
+    """Collect everything a section prints and write it to stdout in one call."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buffer.getvalue())
+
+    return wrapper
+
 
 def print_header(title):
     """Print formatted header."""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print(f"  {title}")
-    print("=" * 70)
+    print(_SEP)
 
 
+@_buffered
 def print_priority_system():
     """Display priority system information."""
     print_header("PRIORITY SYSTEM")
@@ -42,15 +69,14 @@ def print_priority_system():
 
     print("\nPreemption Rules:")
     priorities = list(SystemPriority)
+    names = [SystemPriority.get_name(p) for p in priorities]
     for i, high_pri in enumerate(priorities):
-        for low_pri in priorities[i + 1 :]:
-            high_name = SystemPriority.get_name(high_pri)
-            low_name = SystemPriority.get_name(low_pri)
-            can_preempt = rp.should_preempt(low_pri, high_pri)
-            status = "✓" if can_preempt else "✗"
-            print(f"  {status} {high_name} can preempt {low_name}")
+        for j in range(i + 1, len(priorities)):
+            status = "✓" if rp.should_preempt(priorities[j], high_pri) else "✗"
+            print(f"  {status} {names[i]} can preempt {names[j]}")
 
 
+@_buffered
 def print_storage_allocations(storage_gb=64):
     """Display storage allocations."""
     print_header(f"STORAGE ALLOCATIONS ({storage_gb}GB Total)")
@@ -58,21 +84,21 @@ def print_storage_allocations(storage_gb=64):
     spm = StoragePriorityManager(total_storage_gb=storage_gb)
     allocations = spm.get_all_allocations()
 
-    print("\nCurrent Allocations:")
-    total = 0
-    for name in ["AI", "Android", "Linux", "Windows"]:
-        gb = allocations[name]
-        percentage = (gb / storage_gb) * 100
-        total += gb
-
-        bar_length = int(percentage / 2)
-        bar = "█" * bar_length + "░" * (50 - bar_length)
+    names = ("AI", "Android", "Linux", "Windows")
+    gbs = [allocations[name] for name in names]
+    percentages = [gb * 100 / storage_gb for gb in gbs]
 
+    print("\nCurrent Allocations:")
+    for name, gb, percentage in zip(names, gbs, percentages):
+        bar_length = int(percentage * 0.5)
+        bar = _FULL[:bar_length] + _EMPTY[: 50 - bar_length]
         print(f"  {name:10} [{bar}] {gb:5.1f}GB ({percentage:4.1f}%)")
 
+    total = sum(gbs)
     print(f"\n  Total Used: {total:.1f}GB ({(total/storage_gb)*100:.1f}%)")
 
 
+@_buffered
 def print_partition_suggestions(storage_gb=64):
     """Display partition layout suggestions."""
     print_header("PARTITION LAYOUT SUGGESTIONS")
@@ -84,14 +110,15 @@ def print_partition_suggestions(storage_gb=64):
     print(f"{'Order':<7} {'Component':<10} {'Size':<10} {'Mount Point':<25} {'Description'}")
     print("-" * 90)
 
-    for name in ["AI", "Android", "Linux", "Windows"]:
-        info = suggestions[name]
+    names = ("AI", "Android", "Linux", "Windows")
+    for name, info in zip(names, itemgetter(*names)(suggestions)):
         print(
             f"{info['order']:<7} {name:<10} {info['size_gb']:>6.1f}GB   "
             f"{info['mount_point']:<25} {info['description']}"
         )
 
 
+@_buffered
 def print_system_info():
     """Display system information."""
     print_header("SYSTEM INFORMATION")
@@ -115,6 +142,7 @@ def print_system_info():
     print("    └─ ResourceError")
 
 
+@_buffered
 def print_test_status():
     """Display test status."""
     print_header("TEST STATUS")
@@ -134,6 +162,7 @@ def print_test_status():
     print("    ✓ bandit security scanning configured")
 
 
+@_buffered
 def print_quick_commands():
     """Display quick reference commands."""
     print_header("QUICK COMMANDS")
@@ -170,10 +199,10 @@ def main():
         print_test_status()
         print_quick_commands()
 
-        print("\n" + "=" * 70)
+        print("\n" + _SEP)
         print("  Dashboard generated successfully!")
         print("  For more info, see: docs/ or run 'make help'")
-        print("=" * 70 + "\n")
+        print(_SEP + "\n")
 
         return 0
 
@@ -13,10 +13,15 @@ long_description = readme_file.read_text(encoding="utf-8") if readme_file.exists
 
 # Read requirements
 requirements_file = Path(__file__).parent / "requirements.txt"
-requirements = []
-if requirements_file.exists():
-    with open(requirements_file) as f:
-        requirements = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+requirements = (
+    [
+        line.strip()
+        for line in requirements_file.read_text().splitlines()
+        if line.strip() and not line.startswith("#")
+    ]
+    if requirements_file.exists()
+    else []
+)
 
 setup(
     name="querty-os",
@@ -52,6 +57,9 @@ setup(
             "flake8>=6.1.0",
             "mypy>=1.4.0",
         ],
+        "fast": [
+            "orjson>=3.8.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -0,0 +1,151 @@
+"""
+Test fixtures for Querty-OS test suite.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from core.priority import ResourcePriority, StoragePriorityManager, SystemPriority
+
+SNAPSHOT_SYSTEM_DIR = Path(__file__).resolve().parent.parent / "core" / "snapshot-system"
+
+# Read-only so a test can never alter a case another test relies on
+VALID_ALLOC = MappingProxyType(
+    {
+        SystemPriority.AI: 40.0,
+        SystemPriority.ANDROID: 35.0,
+        SystemPriority.LINUX: 15.0,
+        SystemPriority.WINDOWS: 10.0,
+    }
+)
+
+INVALID_ALLOC_EXCEEDS_TOTAL = MappingProxyType(
+    {
+        SystemPriority.AI: 50.0,
+        SystemPriority.ANDROID: 50.0,
+        SystemPriority.LINUX: 20.0,
+        SystemPriority.WINDOWS: 20.0,
+    }
+)
+
+INVALID_ALLOC_BELOW_MIN = MappingProxyType(
+    {
+        SystemPriority.AI: 20.0,  # Below 30% minimum
+        SystemPriority.ANDROID: 40.0,
+        SystemPriority.LINUX: 20.0,
+        SystemPriority.WINDOWS: 20.0,
+    }
+)
+
+
+def load_snapshot_system():
+    """
+    Import the core/snapshot-system package, whose hyphenated name rules out a normal import.
+
+    Returns:
+        The package module; submodules are available as its attributes
+    """
+    name = "querty_snapshot_system"
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            name,
+            SNAPSHOT_SYSTEM_DIR / "__init__.py",
+            submodule_search_locations=[str(SNAPSHOT_SYSTEM_DIR)],
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+# Return values applied to each fresh mock. copy.copy() of a prebuilt Mock would
+# share its child mocks, so call history would leak between tests.
+LLM_SERVICE_ATTRS = {
+    "load_model.return_value": True,
+    "generate.return_value": "Test response",
+}
+INPUT_HANDLER_ATTRS = {
+    "start.return_value": True,
+    "stop.return_value": None,
+    "process_input.return_value": {"type": "text", "content": "test input"},
+}
+
+
+@pytest.fixture
+def mock_logger():
+    """Mock logger for testing."""
+    return Mock()
+
+
+@pytest.fixture(scope="session")
+def resource_priority():
+    """Resource priority instance shared by the session; treat as read-only."""
+    return ResourcePriority()
+
+
+@pytest.fixture(scope="session")
+def storage_manager():
+    """Storage priority manager with 100GB storage, shared by the session; treat as read-only."""
+    return StoragePriorityManager(total_storage_gb=100.0)
+
+
+@pytest.fixture(scope="session")
+def sample_config():
+    """Sample configuration dictionary shared by the session; treat as read-only."""
+    return {
+        "daemon": {
+            "log_level": "INFO",
+            "log_file": "/tmp/test-daemon.log",
+            "pid_file": "/tmp/test-daemon.pid",
+        },
+        "llm": {
+            "model_path": "/tmp/test-model.gguf",
+            "default_mode": "deterministic",
+        },
+        "priority": {
+            "ai_allocation": 40,
+            "android_allocation": 35,
+            "linux_allocation": 15,
+            "windows_allocation": 10,
+        },
+    }
+
+
+@pytest.fixture
+def mock_llm_service():
+    """Mock LLM service."""
+    return Mock(**LLM_SERVICE_ATTRS)
+
+
+@pytest.fixture
+def mock_input_handler():
+    """Mock input handler."""
+    handler = Mock(**INPUT_HANDLER_ATTRS)
+    # Fresh dict per test so mutations don't leak through the shared template
+    handler.process_input.return_value = dict(INPUT_HANDLER_ATTRS["process_input.return_value"])
+    return handler
+
+
+@pytest.fixture(scope="module")
+def default_rp():
+    """ResourcePriority shared by the module."""
+    return ResourcePriority()
+
+
+@pytest.fixture
+def rp(default_rp):
+    """Shared ResourcePriority with its allocations restored after each test."""
+    saved = default_rp.allocations.copy()
+    yield default_rp
+    default_rp.allocations = saved
+
+
+@pytest.fixture(scope="module")
+def spm100():
+    """Storage priority manager with 100GB storage."""
+    return StoragePriorityManager(total_storage_gb=100.0)
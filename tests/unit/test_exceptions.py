@@ -40,41 +40,32 @@ class TestQuertyOSError:
         error = QuertyOSError("Test error", error_code="TEST_001", details={"key": "value"})
         result = error.to_dict()
 
-        assert result["error_type"] == "QuertyOSError"
-        assert result["message"] == "Test error"
-        assert result["error_code"] == "TEST_001"
-        assert result["details"] == {"key": "value"}
+        assert result == {
+            "error_type": "QuertyOSError",
+            "message": "Test error",
+            "error_code": "TEST_001",
+            "details": {"key": "value"},
+        }
 
 
-class TestAIExceptions:
-    """Test AI-related exceptions."""
+EXCEPTION_CASES = [
+    (AIServiceError, QuertyOSError, "AI_001"),
+    (LLMLoadError, AIServiceError, "LLM_001"),
+    (StorageError, QuertyOSError, "STOR_001"),
+    (StoragePriorityError, StorageError, "STORAGE_PRI_001"),
+    (PriorityViolationError, QuertyOSError, "PRIORITY_001"),
+]
 
-    def test_ai_service_error(self):
-        """Test AI service error."""
-        error = AIServiceError("AI service failed")
-        assert isinstance(error, QuertyOSError)
-        assert str(error) == "AI service failed"
 
-    def test_llm_load_error(self):
-        """Test LLM load error."""
-        error = LLMLoadError("Failed to load model", error_code="LLM_001")
-        assert isinstance(error, AIServiceError)
-        assert error.error_code == "LLM_001"
-
-
-class TestStorageExceptions:
-    """Test storage-related exceptions."""
-
-    def test_storage_error(self):
-        """Test storage error."""
-        error = StorageError("Storage operation failed")
-        assert isinstance(error, QuertyOSError)
-
-    def test_storage_priority_error(self):
-        """Test storage priority error."""
-        error = StoragePriorityError("Priority violation", error_code="STORAGE_PRI_001")
-        assert isinstance(error, StorageError)
-        assert error.error_code == "STORAGE_PRI_001"
+@pytest.mark.parametrize(
+    "cls,parent,code", EXCEPTION_CASES, ids=[case[0].__name__ for case in EXCEPTION_CASES]
+)
+def test_exception_hierarchy(cls, parent, code):
+    """Test each exception subclasses its parent and keeps message and code."""
+    err = cls("msg", error_code=code)
+    assert isinstance(err, parent)
+    assert err.error_code == code
+    assert str(err) == "msg"
 
 
 class TestPriorityExceptions:
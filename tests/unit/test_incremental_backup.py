@@ -0,0 +1,450 @@
+"""
+Unit tests for the incremental backup engine.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from tests.conftest import load_snapshot_system
+
+incremental_backup = load_snapshot_system().incremental_backup
+IncrementalBackup = incremental_backup.IncrementalBackup
+
+
+def write_file(path, data: bytes, mtime: float = 1_700_000_000.0):
+    """Write a file with a fixed mtime so tests control stat metadata."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def pool_entries(engine):
+    """Names of all pool entries, ignoring bucket directories."""
+    if not engine.pool_dir.exists():
+        return []
+    return [entry.name for bucket in engine.pool_dir.iterdir() for entry in bucket.iterdir()]
+
+
+def scan(engine, source, **kwargs):
+    """Scan a source directory into a {relative_path: checksum} dict."""
+    return {fm.path: fm.checksum for fm in engine._iter_scan(source, **kwargs)}
+
+
+@pytest.fixture
+def source(tmp_path):
+    """Empty source directory."""
+    path = tmp_path / "source"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Backup engine storing into a temporary directory."""
+    return IncrementalBackup(str(tmp_path / "backups"))
+
+
+@pytest.fixture
+def hashed(monkeypatch):
+    """Record every file hashed by an engine."""
+
+    def track(engine):
+        paths = []
+        checksum = engine._calculate_file_checksum
+
+        def counting_checksum(file_path, *args, **kwargs):
+            paths.append(os.path.basename(file_path))
+            return checksum(file_path, *args, **kwargs)
+
+        monkeypatch.setattr(engine, "_calculate_file_checksum", counting_checksum)
+        return paths
+
+    return track
+
+
+class TestScan:
+    """Test parallel and serial directory scans."""
+
+    @pytest.fixture
+    def tree(self, source):
+        """Nested tree with enough small files to fill several hashing batches."""
+        contents = {}
+        for i in range(incremental_backup.SMALL_FILE_BATCH * 2 + 5):
+            relative_path = os.path.join(f"dir{i % 3}", f"sub{i % 2}", f"small{i}.txt")
+            contents[relative_path] = f"small file {i}".encode()
+        for i in range(2):
+            contents[f"large{i}.bin"] = os.urandom(incremental_backup.SMALL_FILE_SIZE + 1 + i)
+        for relative_path, data in contents.items():
+            write_file(source / relative_path, data)
+        return contents
+
+    def test_parallel_checksums_match_content(self, engine, source, tree):
+        """Test pooled hashing returns each file's own MD5 digest."""
+        checksums = scan(engine, source, parallel=True)
+
+        assert checksums == {
+            relative_path: hashlib.md5(data).hexdigest() for relative_path, data in tree.items()
+        }
+        assert scan(engine, source, parallel=False) == checksums
+
+    @pytest.mark.parametrize("parallel", [True, False], ids=["parallel", "serial"])
+    def test_walk_prunes_excludes_and_symlinked_dirs(self, engine, source, tree, parallel):
+        """Test both walks list every file once, skipping excluded and linked directories."""
+        os.symlink(source / "dir0", source / "linked")
+        exclude = engine._compile_excludes(["dir1"])
+        walk = engine._walk_files_parallel if parallel else engine._walk_files
+
+        listed = [relative_path for relative_path, _, _ in walk(source, exclude)]
+
+        assert sorted(listed) == sorted(path for path in tree if not path.startswith("dir1"))
+
+
+class TestDeduplication:
+    """Test the hardlinked content pool."""
+
+    def test_identical_files_share_storage(self, engine, source):
+        """Test identical content with identical metadata is stored once."""
+        write_file(source / "a.txt", b"same content")
+        write_file(source / "sub" / "b.txt", b"same content")
+
+        manifest = engine.create_backup(str(source), "full")
+
+        a = os.stat(manifest.files["a.txt"].backup_path)
+        b = os.stat(manifest.files[os.path.join("sub", "b.txt")].backup_path)
+        assert a.st_ino == b.st_ino
+        assert len(pool_entries(engine)) == 1
+
+    def test_different_mtime_keeps_own_metadata(self, engine, source):
+        """Test files differing only in mtime are not linked together."""
+        write_file(source / "a.txt", b"same content", mtime=1_600_000_000.0)
+        write_file(source / "b.txt", b"same content", mtime=1_700_000_000.0)
+
+        manifest = engine.create_backup(str(source), "full")
+
+        a = os.stat(manifest.files["a.txt"].backup_path)
+        b = os.stat(manifest.files["b.txt"].backup_path)
+        assert a.st_ino != b.st_ino
+        assert (a.st_mtime, b.st_mtime) == (1_600_000_000.0, 1_700_000_000.0)
+
+    def test_checksum_collision_is_not_linked(self, engine, tmp_path):
+        """Test a pool hit with different bytes stores the new file separately."""
+        first = write_file(tmp_path / "first", b"AAAA")
+        second = write_file(tmp_path / "second", b"BBBB")
+        dest = tmp_path / "dest"
+        dest.mkdir()
+        checksum = "ab" * 16
+
+        engine._store_file(first, dest / "first", checksum)
+        engine._store_file(second, dest / "second", checksum)
+
+        assert (dest / "second").read_bytes() == b"BBBB"
+        assert os.stat(dest / "first").st_ino != os.stat(dest / "second").st_ino
+
+    def test_concurrent_store_shares_entry(self, engine, source, tmp_path, monkeypatch):
+        """Test a file losing the race to publish is linked to the winner's entry."""
+        first = write_file(source / "a.txt", b"same content")
+        second = write_file(source / "b.txt", b"same content")
+        dest = tmp_path / "dest"
+        dest.mkdir()
+        checksum = "ab" * 16
+        copy_file = engine._copy_file
+
+        def racing_copy(src, dst):
+            # The other worker publishes while this copy is in progress
+            copy_file(src, dst)
+            if src == second:
+                engine._store_file(first, dest / "a.txt", checksum)
+
+        monkeypatch.setattr(engine, "_copy_file", racing_copy)
+        engine._store_file(second, dest / "b.txt", checksum)
+
+        assert os.stat(dest / "a.txt").st_ino == os.stat(dest / "b.txt").st_ino
+        assert (dest / "b.txt").read_bytes() == b"same content"
+        assert sorted(os.listdir(dest)) == ["a.txt", "b.txt"]
+
+    def test_full_backups_share_storage(self, engine, source):
+        """Test repeated full backups of unchanged content link to one copy."""
+        write_file(source / "a.txt", b"content")
+
+        first = engine.create_backup(str(source), "first")
+        second = engine.create_backup(str(source), "second")
+
+        assert (
+            os.stat(first.files["a.txt"].backup_path).st_ino
+            == os.stat(second.files["a.txt"].backup_path).st_ino
+        )
+
+    def test_delete_prunes_unreferenced_entries(self, engine, source):
+        """Test pool entries are removed once no backup links to them."""
+        write_file(source / "a.txt", b"content")
+        first = engine.create_backup(str(source), "first")
+        second = engine.create_backup(str(source), "second")
+
+        assert engine.delete_backup(first.backup_id)
+        assert len(pool_entries(engine)) == 1
+
+        assert engine.delete_backup(second.backup_id)
+        assert pool_entries(engine) == []
+
+    def test_restore_from_linked_files(self, engine, source, tmp_path):
+        """Test restoring linked files reproduces content and mtime."""
+        write_file(source / "a.txt", b"same content", mtime=1_600_000_000.0)
+        write_file(source / "b.txt", b"same content", mtime=1_600_000_000.0)
+        manifest = engine.create_backup(str(source), "full")
+
+        restored = tmp_path / "restored"
+        assert engine.restore_backup(manifest.backup_id, str(restored))
+
+        for name in ("a.txt", "b.txt"):
+            assert (restored / name).read_bytes() == b"same content"
+            assert os.stat(restored / name).st_mtime == 1_600_000_000.0
+
+    def test_unsupported_hardlinks_copy_once(self, engine, source, monkeypatch):
+        """Test each file is copied exactly once when hardlinks fail."""
+        write_file(source / "a.txt", b"same content")
+        write_file(source / "b.txt", b"same content")
+
+        def no_link(*args, **kwargs):
+            raise PermissionError("hardlinks not supported")
+
+        copies = []
+        copy_file = engine._copy_file
+
+        def counting_copy(src, dst):
+            copies.append(dst)
+            copy_file(src, dst)
+
+        monkeypatch.setattr(incremental_backup.os, "link", no_link)
+        monkeypatch.setattr(engine, "_copy_file", counting_copy)
+        engine.parallel = False
+
+        manifest = engine.create_backup(str(source), "full")
+
+        assert len(copies) == 2
+        assert pool_entries(engine) == []
+        assert Path(manifest.files["b.txt"].backup_path).read_bytes() == b"same content"
+
+
+class TestChecksumReads:
+    """Test how source and backup files are read for checksums."""
+
+    @pytest.fixture
+    def medium_file(self, source):
+        """Source file large enough to qualify for mmap hashing."""
+        return write_file(source / "medium.bin", os.urandom(incremental_backup.SMALL_FILE_SIZE + 1))
+
+    def test_source_files_are_not_memory_mapped(self, engine, source, medium_file, monkeypatch):
+        """Test live source files are hashed with reads, never through mmap."""
+
+        def no_mmap(*args, **kwargs):
+            raise AssertionError("source file was memory-mapped")
+
+        monkeypatch.setattr(incremental_backup.mmap, "mmap", no_mmap)
+
+        manifest = engine.create_backup(str(source), "full")
+
+        assert manifest.files["medium.bin"].backed_up
+
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="posix_fadvise unavailable")
+    def test_page_cache_kept_for_files_being_copied(self, engine, source, medium_file, monkeypatch):
+        """Test pages are only dropped after verifying backup copies."""
+        advice = []
+        fadvise = os.posix_fadvise
+
+        def record(fd, offset, length, flag):
+            advice.append(flag)
+            fadvise(fd, offset, length, flag)
+
+        monkeypatch.setattr(incremental_backup.os, "posix_fadvise", record)
+
+        manifest = engine.create_backup(str(source), "full")
+        assert os.POSIX_FADV_DONTNEED not in advice
+
+        assert engine.verify_backup(manifest.backup_id)
+        assert os.POSIX_FADV_DONTNEED in advice
+
+
+class TestPersistedIndex:
+    """Test the on-disk file index that lets new engines skip rehashing."""
+
+    def test_new_engine_reuses_checksums(self, engine, source, hashed):
+        """Test a fresh engine only hashes files changed since the last run."""
+        write_file(source / "a.txt", b"unchanged")
+        write_file(source / "b.txt", b"before")
+        engine.create_backup(str(source), "first")
+
+        write_file(source / "b.txt", b"after", mtime=1_700_000_001.0)
+        fresh = IncrementalBackup(str(engine.backup_dir))
+        paths = hashed(fresh)
+        manifest = fresh.create_backup(str(source), "second")
+
+        assert paths == ["b.txt"]
+        assert manifest.files["a.txt"].checksum == engine.file_index[str(source)]["a.txt"].checksum
+
+    def test_paranoid_does_not_open_index(self, engine, source, hashed, monkeypatch):
+        """Test paranoid backups rehash everything without touching the index."""
+        write_file(source / "a.txt", b"content")
+        engine.create_backup(str(source), "first")
+
+        fresh = IncrementalBackup(str(engine.backup_dir))
+        paths = hashed(fresh)
+
+        def no_index():
+            raise AssertionError("file index opened")
+
+        monkeypatch.setattr(fresh, "_open_file_index", no_index)
+        fresh.create_backup(str(source), "second", paranoid=True)
+
+        assert paths == ["a.txt"]
+
+    def test_unreadable_index_falls_back(self, engine, source, hashed):
+        """Test a corrupt index is ignored and every file is hashed."""
+        write_file(source / "a.txt", b"content")
+        engine.index_db_path.write_bytes(b"not a dbm file")
+        paths = hashed(engine)
+
+        manifest = engine.create_backup(str(source), "full")
+
+        assert paths == ["a.txt"]
+        assert manifest.files["a.txt"].backed_up
+
+    def test_deleted_files_are_dropped(self, engine, source):
+        """Test files gone from the source are removed from the index."""
+        write_file(source / "a.txt", b"kept")
+        write_file(source / "b.txt", b"deleted")
+        engine.create_backup(str(source), "first")
+
+        (source / "b.txt").unlink()
+        engine.create_backup(str(source), "second")
+
+        index_db = engine._open_file_index()
+        try:
+            index = incremental_backup.PersistedFileIndex(index_db, str(source.resolve()))
+            assert sorted(index) == ["a.txt"]
+        finally:
+            index_db.close()
+
+
+class TestChangeDetection:
+    """Test checksum reuse from parent backups."""
+
+    def test_incremental_only_hashes_changed_files(self, engine, source, hashed):
+        """Test unchanged files reuse the parent's checksums and are not copied."""
+        write_file(source / "a.txt", b"unchanged")
+        write_file(source / "b.txt", b"before")
+        parent = engine.create_backup(str(source), "full")
+        write_file(source / "b.txt", b"after!", mtime=1_700_000_001.0)
+
+        paths = hashed(engine)
+        manifest = engine.create_backup(str(source), "incr", parent_backup_id=parent.backup_id)
+
+        assert paths == ["b.txt"]
+        assert (manifest.new_files, manifest.modified_files) == (0, 1)
+        assert not manifest.files["a.txt"].backed_up
+        assert manifest.files["b.txt"].backed_up
+
+    def test_paranoid_detects_change_with_same_stat(self, engine, source):
+        """Test paranoid mode catches content changes that keep size, mtime and inode."""
+        path = write_file(source / "a.txt", b"before")
+        inode = os.stat(path).st_ino
+        parent = engine.create_backup(str(source), "full")
+        write_file(path, b"after!")
+        assert os.stat(path).st_ino == inode
+
+        trusting = engine.create_backup(str(source), "incr", parent_backup_id=parent.backup_id)
+        paranoid = engine.create_backup(
+            str(source), "check", parent_backup_id=parent.backup_id, paranoid=True
+        )
+
+        assert trusting.modified_files == 0
+        assert paranoid.modified_files == 1
+        assert Path(paranoid.files["a.txt"].backup_path).read_bytes() == b"after!"
+
+
+class TestVerify:
+    """Test backup verification."""
+
+    @pytest.fixture
+    def manifest(self, engine, source):
+        """Full backup of 200 distinct files."""
+        for i in range(200):
+            write_file(source / f"file{i}.txt", f"content {i:03d}".encode())
+        return engine.create_backup(str(source), "full")
+
+    def test_full_verify_detects_corruption(self, engine, manifest):
+        """Test a same-size change to a backup copy fails verification."""
+        assert engine.verify_backup(manifest.backup_id)
+
+        Path(manifest.files["file7.txt"].backup_path).write_bytes(b"corrupted!!")
+
+        assert not engine.verify_backup(manifest.backup_id)
+
+    def test_full_verify_detects_missing_file(self, engine, manifest):
+        """Test a deleted backup copy fails verification."""
+        os.unlink(manifest.files["file7.txt"].backup_path)
+
+        assert not engine.verify_backup(manifest.backup_id)
+
+    def test_quick_verify_checks_sample(self, engine, manifest, monkeypatch):
+        """Test quick mode rehashes 1% of the files."""
+        checked = []
+        verify_file = engine._verify_file
+
+        def counting_verify(fm):
+            checked.append(fm.path)
+            return verify_file(fm)
+
+        monkeypatch.setattr(engine, "_verify_file", counting_verify)
+
+        assert engine.verify_backup(manifest.backup_id, quick=True)
+        assert len(checked) == 2
+
+
+class TestRestoreChain:
+    """Test restoring incremental backup chains."""
+
+    def test_restore_takes_newest_version_of_each_file(self, engine, source, tmp_path):
+        """Test a chain restore copies each path from the newest backup holding it."""
+        write_file(source / "a.txt", b"a1")
+        write_file(source / "sub" / "b.txt", b"b1")
+        full = engine.create_backup(str(source), "full")
+        write_file(source / "a.txt", b"a2", mtime=1_700_000_001.0)
+        middle = engine.create_backup(str(source), "middle", parent_backup_id=full.backup_id)
+        write_file(source / "sub" / "c.txt", b"c3")
+        last = engine.create_backup(str(source), "last", parent_backup_id=middle.backup_id)
+
+        assert engine.get_backup_chain(last.backup_id) == [
+            full.backup_id,
+            middle.backup_id,
+            last.backup_id,
+        ]
+
+        restored = tmp_path / "restored"
+        assert engine.restore_backup(last.backup_id, str(restored))
+
+        assert {
+            str(path.relative_to(restored)): path.read_bytes()
+            for path in restored.rglob("*")
+            if path.is_file()
+        } == {
+            "a.txt": b"a2",
+            os.path.join("sub", "b.txt"): b"b1",
+            os.path.join("sub", "c.txt"): b"c3",
+        }
+
+    def test_deleted_backup_leaves_chain_cache(self, engine, source):
+        """Test deleting a chain drops the cached chains of every deleted backup."""
+        write_file(source / "a.txt", b"a1")
+        full = engine.create_backup(str(source), "full")
+        write_file(source / "a.txt", b"a2", mtime=1_700_000_001.0)
+        child = engine.create_backup(str(source), "child", parent_backup_id=full.backup_id)
+
+        assert not engine.delete_backup(full.backup_id)
+        assert engine.delete_backup(full.backup_id, delete_children=True)
+
+        assert engine._chain_cache == {}
+        assert engine.get_backup(child.backup_id) is None
@@ -0,0 +1,80 @@
+"""
+Unit tests for the Querty-OS memory manager.
+"""
+
+import pytest
+
+from core.memory_manager import ContextWindowManager
+
+
+@pytest.fixture
+def context(tmp_path):
+    """Context window manager with a 100-token budget and storage under tmp_path."""
+    return ContextWindowManager(max_tokens=100, storage_path=tmp_path / "memory")
+
+
+def fill(context, count, tokens):
+    """Add count messages of the given size without pruning them."""
+    budget = context.max_tokens
+    context.max_tokens = context.message_tokens + count * tokens
+    ids = [context.add_message("user", f"message {i}", tokens=tokens) for i in range(count)]
+    context.max_tokens = budget
+    return ids
+
+
+class TestMessageWorkingSet:
+    """Test the LRU message working set."""
+
+    def test_token_estimate(self, context):
+        """Test the token count defaults to a quarter of the text length, at least one."""
+        context.add_message("user", "x" * 40)
+        context.add_message("user", "")
+
+        assert [tokens for _, _, tokens in context.messages.values()] == [10, 1]
+        assert context.message_tokens == 11
+
+    def test_should_prune_threshold(self, context):
+        """Test pruning is needed only once the working set exceeds max_tokens."""
+        fill(context, 4, 25)
+        assert context.message_tokens == 100
+        assert not context.should_prune()
+
+        fill(context, 1, 1)
+        assert context.should_prune()
+
+    def test_prune_evicts_least_recently_used(self, context):
+        """Test prune drops the oldest untouched messages and reports the tokens freed."""
+        first, second, third, fourth = fill(context, 4, 40)
+        assert context.touch_message(first)
+
+        assert context.prune() == 80
+
+        assert list(context.messages) == [fourth, first]
+        assert context.message_tokens == 80
+        assert not context.touch_message(second)
+        assert not context.touch_message(third)
+        assert context.prune() == 0
+
+    def test_add_message_prunes_automatically(self, context):
+        """Test adding past the budget evicts the least recently used messages."""
+        first, second = (context.add_message("user", f"m{i}", tokens=40) for i in range(2))
+        context.touch_message(first)
+
+        third = context.add_message("assistant", "reply", tokens=40)
+
+        assert list(context.messages) == [first, third]
+        assert context.message_tokens == 80
+        assert not context.should_prune()
+
+    def test_summary_and_clear_all(self, context):
+        """Test the summary reports messages and clear_all removes them."""
+        fill(context, 3, 10)
+
+        summary = context.get_context_summary()
+        assert (summary["total_messages"], summary["message_tokens"]) == (3, 30)
+
+        context.clear_all()
+
+        assert not context.messages
+        summary = context.get_context_summary()
+        assert (summary["total_messages"], summary["message_tokens"]) == (0, 0)
@@ -0,0 +1,151 @@
+"""
+Unit tests for the Querty-OS plugin system.
+"""
+
+import json
+import sys
+
+import pytest
+
+from core.plugin_system import LazyPlugin, PluginManager, PluginType
+from examples.plugins.calculator_plugin import CalculatorPlugin
+from examples.plugins.greeter_skill import GreeterSkill
+from examples.plugins.system_monitor_plugin import SystemMonitorPlugin
+
+PLUGIN_SOURCE = """
+from core.plugin_system import Plugin, PluginType
+
+events = []
+
+
+class EchoPlugin(Plugin):
+    def __init__(self):
+        super().__init__(name="Echo", version="1.0.0", plugin_type=PluginType.TOOL)
+        self.metadata = {"author": "tests"}
+        events.append("construct")
+
+    def initialize(self):
+        events.append("initialize")
+        self.enabled = True
+        return True
+
+    def execute(self, **kwargs):
+        return kwargs
+
+    def shutdown(self):
+        events.append("shutdown")
+        self.enabled = False
+
+
+class BrokenPlugin(EchoPlugin):
+    def initialize(self):
+        events.append("initialize")
+        return False
+"""
+
+
+@pytest.fixture
+def plugin_module(tmp_path, monkeypatch):
+    """Name of an importable plugin module that has not been imported yet."""
+    name = f"lazy_echo_{tmp_path.name}"
+    (tmp_path / f"{name}.py").write_text(PLUGIN_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+    sys.modules.pop(name, None)
+
+
+@pytest.fixture
+def manager(tmp_path, plugin_module):
+    """Plugin manager holding one lazy plugin under the name "echo"."""
+    manager = PluginManager(plugin_dir=str(tmp_path))
+    manager.loaded_plugins["echo"] = LazyPlugin(
+        "Echo", "1.0.0", PluginType.TOOL, plugin_module, "EchoPlugin"
+    )
+    return manager
+
+
+class TestLazyPlugin:
+    """Test plugins whose module is imported on first use."""
+
+    def test_management_does_not_import(self, manager, plugin_module):
+        """Test listing, enabling, disabling and info use only the declared metadata."""
+        assert manager.list_plugins(PluginType.TOOL) == ["echo"]
+        assert manager.list_plugins(PluginType.SENSOR) == []
+        assert manager.enable_plugin("echo")
+        assert manager.get_plugin_info("echo")["enabled"] is True
+        assert manager.disable_plugin("echo")
+        assert manager.execute_plugin("echo", value=1) is None
+
+        assert manager.get_plugin_info("echo")["name"] == "Echo"
+        assert not manager.loaded_plugins["echo"].loaded
+        assert plugin_module not in sys.modules
+
+    def test_unload_never_loaded_skips_shutdown(self, manager, plugin_module):
+        """Test unloading a plugin that was never used does not import it."""
+        assert manager.unload_plugin("echo")
+
+        assert "echo" not in manager.loaded_plugins
+        assert plugin_module not in sys.modules
+
+    def test_execute_loads_once(self, manager, plugin_module):
+        """Test the first execute loads the plugin and later calls reuse it."""
+        manager.enable_plugin("echo")
+
+        assert manager.execute_plugin("echo", value=1) == {"value": 1}
+        assert manager.execute_plugin("echo", value=2) == {"value": 2}
+
+        plugin = manager.loaded_plugins["echo"]
+        assert plugin.loaded
+        assert plugin.metadata == {"author": "tests"}
+        assert sys.modules[plugin_module].events == ["construct", "initialize"]
+
+    def test_unload_shuts_down_loaded_plugin(self, manager, plugin_module):
+        """Test unloading a used plugin shuts the underlying plugin down."""
+        manager.enable_plugin("echo")
+        manager.execute_plugin("echo")
+        plugin = manager.loaded_plugins["echo"]
+
+        assert manager.unload_plugin("echo")
+
+        assert sys.modules[plugin_module].events[-1] == "shutdown"
+        assert plugin.enabled is False
+
+    def test_failed_initialize_is_not_kept(self, manager, plugin_module):
+        """Test a plugin that fails to initialize is reported, disabled and retried."""
+        manager.loaded_plugins["broken"] = LazyPlugin(
+            "Broken", "1.0.0", PluginType.TOOL, plugin_module, "BrokenPlugin"
+        )
+        manager.enable_plugin("broken")
+        plugin = manager.loaded_plugins["broken"]
+
+        with pytest.raises(RuntimeError, match="failed to initialize"):
+            manager.execute_plugin("broken")
+
+        assert not plugin.loaded
+        assert not plugin.enabled
+        assert manager.execute_plugin("broken") is None
+        assert plugin.initialize() is False
+        assert sys.modules[plugin_module].events == ["construct", "initialize"] * 2
+
+
+class TestPluginInfo:
+    """Test plugin info reports."""
+
+    @pytest.mark.parametrize("plugin_class", [CalculatorPlugin, GreeterSkill, SystemMonitorPlugin])
+    def test_example_plugin_info_is_json(self, plugin_class):
+        """Test the example plugins' info, including shared metadata, serializes to JSON."""
+        info = plugin_class().get_info()
+
+        assert json.loads(json.dumps(info))["metadata"]["author"] == "Querty-OS Team"
+
+    def test_info_metadata_is_a_copy(self, tmp_path):
+        """Test changing reported metadata leaves the plugin and other instances untouched."""
+        manager = PluginManager(plugin_dir=str(tmp_path))
+        manager.loaded_plugins["calculator"] = CalculatorPlugin()
+
+        info = manager.get_plugin_info("calculator")
+        json.dumps(info)
+        info["metadata"]["author"] = "someone else"
+
+        assert manager.loaded_plugins["calculator"].metadata["author"] == "Querty-OS Team"
+        assert CalculatorPlugin().metadata["author"] == "Querty-OS Team"
@@ -4,7 +4,8 @@ Unit tests for Querty-OS priority management system.
 
 import pytest
 
-from core.priority import ResourcePriority, StoragePriorityManager, SystemPriority
+from core.priority import SystemPriority
+from tests.conftest import INVALID_ALLOC_BELOW_MIN, INVALID_ALLOC_EXCEEDS_TOTAL, VALID_ALLOC
 
 
 class TestSystemPriority:
@@ -12,16 +13,21 @@ class TestSystemPriority:
 
     def test_priority_values(self):
         """Test priority values are in correct order."""
-        assert SystemPriority.AI > SystemPriority.ANDROID
-        assert SystemPriority.ANDROID > SystemPriority.LINUX
-        assert SystemPriority.LINUX > SystemPriority.WINDOWS
+        assert (
+            SystemPriority.AI,
+            SystemPriority.ANDROID,
+            SystemPriority.LINUX,
+            SystemPriority.WINDOWS,
+        ) == tuple(sorted(SystemPriority, reverse=True))
 
     def test_priority_order(self):
         """Test priorities are ordered correctly."""
-        assert SystemPriority.AI.value == 4
-        assert SystemPriority.ANDROID.value == 3
-        assert SystemPriority.LINUX.value == 2
-        assert SystemPriority.WINDOWS.value == 1
+        assert (
+            SystemPriority.AI.value,
+            SystemPriority.ANDROID.value,
+            SystemPriority.LINUX.value,
+            SystemPriority.WINDOWS.value,
+        ) == (4, 3, 2, 1)
 
     def test_get_name(self):
         """Test getting human-readable names."""
@@ -34,35 +40,28 @@ class TestSystemPriority:
 class TestResourcePriority:
     """Test ResourcePriority class."""
 
-    def test_default_allocations(self):
+    def test_default_allocations(self, rp):
         """Test default resource allocations."""
-        rp = ResourcePriority()
-
         assert rp.get_allocation(SystemPriority.AI) == 40
         assert rp.get_allocation(SystemPriority.ANDROID) == 35
         assert rp.get_allocation(SystemPriority.LINUX) == 15
         assert rp.get_allocation(SystemPriority.WINDOWS) == 10
 
-    def test_set_allocation(self):
+    def test_set_allocation(self, rp):
         """Test setting resource allocation."""
-        rp = ResourcePriority()
-
         # Should succeed
         assert rp.set_allocation(SystemPriority.AI, 50) is True
         assert rp.get_allocation(SystemPriority.AI) == 50
 
-    def test_minimum_allocation_enforcement(self):
+    def test_minimum_allocation_enforcement(self, rp):
         """Test minimum allocations are enforced."""
-        rp = ResourcePriority()
-
         # Should fail - below minimum
         assert rp.set_allocation(SystemPriority.AI, 20) is False
         # Should still be at default
         assert rp.get_allocation(SystemPriority.AI) == 40
 
-    def test_get_priority_order(self):
+    def test_get_priority_order(self, rp):
         """Test getting priorities in order."""
-        rp = ResourcePriority()
         order = rp.get_priority_order()
 
         assert order[0] == SystemPriority.AI
@@ -70,10 +69,8 @@ class TestResourcePriority:
         assert order[2] == SystemPriority.LINUX
         assert order[3] == SystemPriority.WINDOWS
 
-    def test_should_preempt(self):
+    def test_should_preempt(self, rp):
         """Test preemption logic."""
-        rp = ResourcePriority()
-
         # AI should preempt Windows
         assert rp.should_preempt(SystemPriority.WINDOWS, SystemPriority.AI) is True
 
@@ -83,20 +80,22 @@ class TestResourcePriority:
         # Android should preempt Linux
         assert rp.should_preempt(SystemPriority.LINUX, SystemPriority.ANDROID) is True
 
-    def test_rebalance_resources(self):
+    def test_rebalance_resources(self, rp):
         """Test resource rebalancing."""
-        rp = ResourcePriority()
-
         # Test with 80% available
         allocations = rp.rebalance_resources(80)
 
         # All priorities should get something
-        assert all(allocations[p] > 0 for p in SystemPriority)
+        assert allocations.keys() == set(SystemPriority)
+        assert min(allocations.values()) > 0
 
         # AI should get the most
-        assert allocations[SystemPriority.AI] >= allocations[SystemPriority.ANDROID]
-        assert allocations[SystemPriority.ANDROID] >= allocations[SystemPriority.LINUX]
-        assert allocations[SystemPriority.LINUX] >= allocations[SystemPriority.WINDOWS]
+        assert (
+            allocations[SystemPriority.AI]
+            >= allocations[SystemPriority.ANDROID]
+            >= allocations[SystemPriority.LINUX]
+            >= allocations[SystemPriority.WINDOWS]
+        )
 
         # Total should be 80%
         assert sum(allocations.values()) == 80
@@ -105,96 +104,59 @@ class TestResourcePriority:
 class TestStoragePriorityManager:
     """Test StoragePriorityManager class."""
 
-    def test_initialization(self):
+    def test_initialization(self, spm100):
         """Test storage manager initialization."""
-        spm = StoragePriorityManager(total_storage_gb=100.0)
-        assert spm.total_storage == 100.0
+        assert spm100.total_storage == 100.0
 
-    def test_get_storage_allocation(self):
+    def test_get_storage_allocation(self, spm100):
         """Test getting storage allocation."""
-        spm = StoragePriorityManager(total_storage_gb=100.0)
-
         # AI should get 40% of 100GB = 40GB
-        ai_storage = spm.get_storage_allocation(SystemPriority.AI)
+        ai_storage = spm100.get_storage_allocation(SystemPriority.AI)
         assert ai_storage == 40.0
 
         # Android should get 35% of 100GB = 35GB
-        android_storage = spm.get_storage_allocation(SystemPriority.ANDROID)
+        android_storage = spm100.get_storage_allocation(SystemPriority.ANDROID)
         assert android_storage == 35.0
 
-    def test_get_all_allocations(self):
+    def test_get_all_allocations(self, spm100):
         """Test getting all allocations."""
-        spm = StoragePriorityManager(total_storage_gb=100.0)
-        allocations = spm.get_all_allocations()
+        allocations = spm100.get_all_allocations()
 
-        assert "AI" in allocations
-        assert "Android" in allocations
-        assert "Linux" in allocations
-        assert "Windows" in allocations
+        assert {"AI", "Android", "Linux", "Windows"} <= allocations.keys()
 
         # Total should be 100GB
         assert sum(allocations.values()) == 100.0
 
-    def test_suggest_partition_sizes(self):
+    def test_suggest_partition_sizes(self, spm100):
         """Test partition size suggestions."""
-        spm = StoragePriorityManager(total_storage_gb=100.0)
-        suggestions = spm.suggest_partition_sizes()
+        suggestions = spm100.suggest_partition_sizes()
 
         # All components should have suggestions
-        assert "AI" in suggestions
-        assert "Android" in suggestions
-        assert "Linux" in suggestions
-        assert "Windows" in suggestions
-
-        # AI should be first in order
-        assert suggestions["AI"]["order"] == 1
-        assert suggestions["Android"]["order"] == 2
-
-        # Check mount points are defined
-        assert suggestions["AI"]["mount_point"] == "/data/querty-ai"
-        assert suggestions["Linux"]["mount_point"] == "/data/linux"
-
-    def test_validate_allocation_success(self):
-        """Test validation of valid allocation."""
-        spm = StoragePriorityManager(total_storage_gb=100.0)
-
-        requested = {
-            SystemPriority.AI: 40.0,
-            SystemPriority.ANDROID: 35.0,
-            SystemPriority.LINUX: 15.0,
-            SystemPriority.WINDOWS: 10.0,
-        }
+        assert {"AI", "Android", "Linux", "Windows"} <= suggestions.keys()
 
-        is_valid, error = spm.validate_allocation(requested)
-        assert is_valid is True
-        assert error is None
-
-    def test_validate_allocation_exceeds_total(self):
-        """Test validation fails when exceeding total."""
-        spm = StoragePriorityManager(total_storage_gb=100.0)
-
-        requested = {
-            SystemPriority.AI: 50.0,
-            SystemPriority.ANDROID: 50.0,
-            SystemPriority.LINUX: 20.0,
-            SystemPriority.WINDOWS: 20.0,
+        # AI should be first in order, and mount points are defined
+        expected_subset = {
+            "AI": {"order": 1, "mount_point": "/data/querty-ai"},
+            "Android": {"order": 2},
+            "Linux": {"mount_point": "/data/linux"},
         }
-
-        is_valid, error = spm.validate_allocation(requested)
-        assert is_valid is False
-        assert "exceeds available" in error
-
-    def test_validate_allocation_below_minimum(self):
-        """Test validation fails when below minimum."""
-        spm = StoragePriorityManager(total_storage_gb=100.0)
-
-        requested = {
-            SystemPriority.AI: 20.0,  # Below 30% minimum
-            SystemPriority.ANDROID: 40.0,
-            SystemPriority.LINUX: 20.0,
-            SystemPriority.WINDOWS: 20.0,
-        }
-
-        is_valid, error = spm.validate_allocation(requested)
-        assert is_valid is False
-        assert "below minimum" in error
+        for name, fields in expected_subset.items():
+            assert suggestions[name].items() >= fields.items()
+
+    @pytest.mark.parametrize(
+        "alloc,expected_valid,expected_substring",
+        [
+            (VALID_ALLOC, True, None),
+            (INVALID_ALLOC_EXCEEDS_TOTAL, False, "exceeds available"),
+            (INVALID_ALLOC_BELOW_MIN, False, "below minimum"),
+        ],
+        ids=["valid", "exceeds", "below_min"],
+    )
+    def test_validate_allocation(self, spm100, alloc, expected_valid, expected_substring):
+        """Test allocation validation outcomes."""
+        is_valid, error = spm100.validate_allocation(alloc)
+        assert is_valid is expected_valid
+        if expected_substring is None:
+            assert error is None
+        else:
+            assert expected_substring in error
@@ -0,0 +1,257 @@
+"""
+Unit tests for the rollback manager.
+"""
+
+import sqlite3
+from dataclasses import asdict
+
+import pytest
+
+from tests.conftest import load_snapshot_system
+
+rollback_manager = load_snapshot_system().rollback_manager
+RollbackManager = rollback_manager.RollbackManager
+RollbackScope = rollback_manager.RollbackScope
+RollbackState = rollback_manager.RollbackState
+SafetyCheck = rollback_manager.SafetyCheck
+SafetyCheckType = rollback_manager.SafetyCheckType
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Rollback manager storing its data in a temporary directory."""
+    with RollbackManager(str(tmp_path / "rollback")) as manager:
+        yield manager
+
+
+@pytest.fixture
+def checker_calls(manager):
+    """Replace the default safety checkers with passing ones that count their calls."""
+    calls = []
+
+    def register(check_type):
+        def checker():
+            calls.append(check_type)
+            return SafetyCheck(check_type=check_type, passed=True, message="ok")
+
+        manager.register_safety_checker(check_type, checker)
+
+    for check_type in list(manager.safety_checkers):
+        register(check_type)
+    return calls
+
+
+class TestPointStore:
+    """Test the SQLite point store and its in-memory LRU cache."""
+
+    def test_points_persist_across_instances(self, manager):
+        """Test a new manager on the same directory sees existing points, newest first."""
+        first = manager.create_rollback_point("first", "", RollbackScope.FILESYSTEM)
+        second = manager.create_rollback_point("second", "", RollbackScope.CONFIGURATION)
+
+        with RollbackManager(str(manager.data_dir)) as reopened:
+            assert [p.point_id for p in reopened.list_rollback_points()] == [
+                second.point_id,
+                first.point_id,
+            ]
+            assert [p.point_id for p in reopened.list_rollback_points(limit=1)] == [second.point_id]
+            assert [
+                p.point_id for p in reopened.list_rollback_points(scope=RollbackScope.FILESYSTEM)
+            ] == [first.point_id]
+            assert reopened.get_rollback_point(first.point_id).name == "first"
+
+    def test_point_round_trips_through_store(self, manager):
+        """Test a point reloaded from points.db equals the one created, timestamps included."""
+        point = manager.create_rollback_point(
+            "full", "all fields", RollbackScope.APPLICATION, "snap", "backup", "/cfg.tar"
+        )
+
+        with RollbackManager(str(manager.data_dir)) as reopened:
+            reloaded = reopened.get_rollback_point(point.point_id)
+
+        assert reloaded is not point
+        assert asdict(reloaded) == asdict(point)
+        assert isinstance(reloaded.created_at, int)
+        assert reloaded.created_at_dt == point.created_at_dt
+        assert reloaded.verified_at is None and reloaded.verified_at_dt is None
+
+    def test_cache_evicts_least_recently_used(self, manager, monkeypatch):
+        """Test only the newest points stay cached and evicted ones reload from disk."""
+        monkeypatch.setattr(rollback_manager, "POINT_CACHE_SIZE", 2)
+        a, b, c = (
+            manager.create_rollback_point(name, "", RollbackScope.FILESYSTEM)
+            for name in ("a", "b", "c")
+        )
+
+        assert list(manager.rollback_points) == [b.point_id, c.point_id]
+
+        reloaded = manager.get_rollback_point(a.point_id)
+
+        assert reloaded is not a
+        assert (reloaded.name, reloaded.created_at) == ("a", a.created_at)
+        assert list(manager.rollback_points) == [c.point_id, a.point_id]
+
+    def test_delete_removes_from_store(self, manager):
+        """Test a deleted point is gone from the cache and from points.db."""
+        point = manager.create_rollback_point("gone", "", RollbackScope.FILESYSTEM)
+
+        assert manager.delete_rollback_point(point.point_id)
+
+        assert manager.get_rollback_point(point.point_id) is None
+        with RollbackManager(str(manager.data_dir)) as reopened:
+            assert reopened.list_rollback_points() == []
+        assert not manager.delete_rollback_point(point.point_id)
+
+
+class TestLifecycle:
+    """Test releasing the point store."""
+
+    def test_close_releases_store(self, tmp_path):
+        """Test close() closes the SQLite connection and the with block calls it."""
+        with RollbackManager(str(tmp_path / "rollback")) as manager:
+            manager.create_rollback_point("kept", "", RollbackScope.FILESYSTEM)
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            manager.list_rollback_points()
+
+        with RollbackManager(str(tmp_path / "rollback")) as reopened:
+            assert [p.name for p in reopened.list_rollback_points()] == ["kept"]
+
+
+class TestSafetyCheckCache:
+    """Test reuse of recent safety-check results."""
+
+    def test_results_reused_within_ttl(self, manager, checker_calls):
+        """Test a second run inside the TTL does not invoke the checkers."""
+        first = manager.run_safety_checks()
+        second = manager.run_safety_checks()
+
+        assert len(checker_calls) == len(first) == 3
+        assert second == first
+
+    def test_force_refresh_reruns_checkers(self, manager, checker_calls):
+        """Test force_refresh bypasses cached results."""
+        manager.run_safety_checks()
+        manager.run_safety_checks(force_refresh=True)
+
+        assert len(checker_calls) == 6
+
+    def test_expired_results_rerun(self, manager, checker_calls):
+        """Test results older than the TTL are recomputed."""
+        manager._check_ttl = 0.0
+
+        manager.run_safety_checks()
+        manager.run_safety_checks()
+
+        assert len(checker_calls) == 6
+
+    def test_register_invalidates_cached_result(self, manager, checker_calls):
+        """Test replacing a checker discards its cached result only."""
+        manager.run_safety_checks()
+
+        manager.register_safety_checker(
+            SafetyCheckType.DISK_SPACE,
+            lambda: SafetyCheck(SafetyCheckType.DISK_SPACE, passed=False, message="full"),
+        )
+        results = manager.run_safety_checks()
+
+        assert len(checker_calls) == 3
+        assert [c.passed for c in results if c.check_type == SafetyCheckType.DISK_SPACE] == [False]
+
+    def test_results_follow_checker_order(self, manager, checker_calls):
+        """Test results come back in registration order and a raising checker fails."""
+
+        def broken():
+            raise OSError("no /proc")
+
+        manager.register_safety_checker(SafetyCheckType.SYSTEM_LOAD, broken)
+
+        results = manager.run_safety_checks()
+        again = manager.run_safety_checks()
+
+        assert [c.check_type for c in results] == list(manager.safety_checkers)
+        assert [c.passed for c in results] == [True, False, True]
+        assert "no /proc" in results[1].message
+        # Failures are not cached, so the broken checker is retried
+        assert again[1] is not results[1]
+        assert len(checker_calls) == 2
+
+
+class TestInitiateRollback:
+    """Test rollback initiation."""
+
+    def test_noop_point_skips_checks_and_checkpoint(self, manager, checker_calls):
+        """Test a point referencing nothing completes without checks or a checkpoint."""
+        point = manager.create_rollback_point("empty", "", RollbackScope.FULL_SYSTEM)
+
+        operation = manager.initiate_rollback(point.point_id)
+
+        assert operation.state == RollbackState.COMPLETED
+        assert operation.pre_rollback_point is None
+        assert operation.started_at <= operation.completed_at
+        assert operation.completed_at_dt >= operation.started_at_dt
+        assert checker_calls == []
+        assert len(manager.list_rollback_points()) == 1
+
+    def test_point_with_config_runs_checks_and_checkpoint(self, manager, checker_calls, tmp_path):
+        """Test a point with something to restore takes the full path."""
+        config = tmp_path / "config.tar"
+        config.write_bytes(b"config")
+        point = manager.create_rollback_point(
+            "config", "", RollbackScope.CONFIGURATION, config_backup=str(config)
+        )
+
+        operation = manager.initiate_rollback(point.point_id)
+
+        assert operation.state == RollbackState.COMPLETED
+        assert len(checker_calls) == 3
+        assert manager.get_rollback_point(operation.pre_rollback_point) is not None
+
+
+class TestVerifyRollbackPoints:
+    """Test batch verification of rollback points."""
+
+    def test_batch_matches_single_verification(self, manager, tmp_path):
+        """Test batch results agree with verify_rollback_point, dangling links included."""
+        present = tmp_path / "present.tar"
+        present.write_bytes(b"config")
+        dangling = tmp_path / "dangling.tar"
+        dangling.symlink_to(tmp_path / "deleted.tar")
+        configs = {
+            "present": str(present),
+            "missing": str(tmp_path / "missing.tar"),
+            "dangling": str(dangling),
+            "none": None,
+        }
+        ids = {
+            name: manager.create_rollback_point(
+                name, "", RollbackScope.CONFIGURATION, config_backup=config
+            ).point_id
+            for name, config in configs.items()
+        }
+
+        results = manager.verify_rollback_points(list(ids.values()) + ["unknown"])
+
+        validity = {"present": True, "missing": False, "dangling": False, "none": True}
+        expected = {ids[name]: valid for name, valid in validity.items()}
+        expected["unknown"] = False
+        assert results == expected
+        with RollbackManager(str(manager.data_dir)) as reopened:
+            assert {
+                point_id: reopened.verify_rollback_point(point_id) for point_id in results
+            } == results
+
+    def test_recent_result_is_reused(self, manager, tmp_path):
+        """Test a freshly verified point is not re-checked on disk."""
+        config = tmp_path / "config.tar"
+        config.write_bytes(b"config")
+        point = manager.create_rollback_point(
+            "config", "", RollbackScope.CONFIGURATION, config_backup=str(config)
+        )
+        assert manager.verify_rollback_points([point.point_id]) == {point.point_id: True}
+
+        config.unlink()
+
+        assert manager.verify_rollback_points([point.point_id]) == {point.point_id: True}
+        point.verified_at -= int(rollback_manager.VERIFY_CACHE_SECONDS * 1e9)
+        assert manager.verify_rollback_points([point.point_id]) == {point.point_id: False}
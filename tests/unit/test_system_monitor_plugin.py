@@ -0,0 +1,91 @@
+"""
+Unit tests for the example system monitor plugin.
+"""
+
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from examples.plugins import system_monitor_plugin
+from examples.plugins.system_monitor_plugin import SystemMonitorPlugin
+
+
+class FakePsutil(SimpleNamespace):
+    """Stand-in psutil whose sampler-length readings wait for the test to release them."""
+
+    def __init__(self):
+        super().__init__(
+            cpu_count=lambda: 4,
+            virtual_memory=lambda: SimpleNamespace(total=2 * 1024**3, used=1024**3, percent=50.0),
+            disk_usage=lambda path: SimpleNamespace(total=10 * 1024**3, used=1024**3, percent=10.0),
+        )
+        self.intervals = []
+        self.release_sample = threading.Event()
+
+    def cpu_percent(self, interval=None):
+        self.intervals.append(interval)
+        if interval is None:
+            # psutil's first non-blocking reading
+            return 0.0
+        if interval == system_monitor_plugin.CPU_SAMPLE_INTERVAL:
+            self.release_sample.wait(5.0)
+            time.sleep(0.01)  # stands in for the measurement window
+            return 42.0
+        return 12.5
+
+
+@pytest.fixture
+def fake_psutil(monkeypatch):
+    """Fake psutil module with fixed readings, not yet imported by the plugin."""
+    fake = FakePsutil()
+    monkeypatch.setitem(sys.modules, "psutil", fake)
+    monkeypatch.setattr(system_monitor_plugin, "psutil", None)
+    yield fake
+    # Let a sampler left running by a failed test exit
+    fake.release_sample.set()
+
+
+class TestSystemMonitorPlugin:
+    """Test SystemMonitorPlugin metric collection."""
+
+    def test_execute_before_initialize(self, fake_psutil):
+        """Test every metric can be read without calling initialize() first."""
+        monitor = SystemMonitorPlugin()
+
+        metrics = monitor.execute(metric="all")
+
+        assert metrics["cpu"] == {"cpu_percent": 12.5, "cpu_count": 4}
+        assert metrics["memory"] == {"total_mb": 2048.0, "used_mb": 1024.0, "percent": 50.0}
+        assert metrics["disk"] == {"total_gb": 10.0, "used_gb": 1.0, "percent": 10.0}
+        assert system_monitor_plugin.psutil is fake_psutil
+
+    def test_unknown_metric(self, fake_psutil):
+        """Test an unknown metric name is rejected."""
+        with pytest.raises(ValueError, match="Unknown metric"):
+            SystemMonitorPlugin().execute(metric="gpu")
+
+    def test_sampler_lifecycle(self, fake_psutil):
+        """Test initialize starts the sampler, its readings are served, and shutdown stops it."""
+        monitor = SystemMonitorPlugin()
+        assert monitor.initialize()
+        sampler = monitor._sampler
+        assert sampler.is_alive()
+
+        # No sampler reading yet: a short reading, never psutil's initial 0.0
+        assert monitor.execute(metric="cpu") == {"cpu_percent": 12.5, "cpu_count": 4}
+
+        fake_psutil.release_sample.set()
+        deadline = time.monotonic() + 5.0
+        while monitor.execute(metric="cpu")["cpu_percent"] != 42.0:
+            assert time.monotonic() < deadline, "sampler reading never published"
+            time.sleep(0.01)
+
+        monitor.shutdown()
+
+        assert not sampler.is_alive()
+        assert monitor._sampler is None
+        assert not monitor.enabled
+        assert None not in fake_psutil.intervals